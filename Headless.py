@@ -0,0 +1,138 @@
+########################################################### IMPORTS
+# IMPORT TIME
+from time import perf_counter
+
+# IMPORT SYS / OS
+from sys import path as sys_path
+from sys import exit as sys_exit
+from sys import argv
+from os import path as os_path, environ
+
+# NO WINDOW / NO SOUND CARD, SET BEFORE PYGAME STARTS
+environ['SDL_VIDEODRIVER'] = "dummy"
+environ['SDL_AUDIODRIVER'] = "dummy"
+
+# IMPORT PYGAME
+import pygame
+
+# CUSTOM DATA TYPES
+from scripts.DataTypes import SettingData
+
+# CUSTOM COMPONENTS
+from scripts.WindowComponents import ASSETS
+
+# SHARED SETUP
+from scripts.Bootstrap import window_size, create_game, load_game
+
+
+########################################################### ARGV
+# Headless.py [frames=N] [ticks=N] [speed=N] [scene=NAME] [size=WxH] [load] [norender]
+FRAMES = 600
+TICKS = 0
+SPEED = 1.0
+SCENE = "main_menu"
+# DUMMY DRIVER HAS NO DESKTOP, WINDOW IS SIZED AS ON A SCREEN OF THIS SIZE
+SCREEN_SIZE = (1920, 1080)
+LOAD_SAVE = False
+RENDER = True
+if len(argv) > 0:
+    for argument in argv[1:]:
+        name, _, value = argument.partition("=")
+        if name == "frames":
+            FRAMES = int(value)
+        elif name == "ticks":
+            TICKS = int(value)
+        elif name == "speed":
+            SPEED = float(value)
+        elif name == "scene":
+            SCENE = value
+        elif name == "size":
+            width, _, height = value.partition("x")
+            SCREEN_SIZE = (int(width), int(height))
+        elif name == "load":
+            LOAD_SAVE = True
+        elif name == "norender":
+            RENDER = False
+
+########################################################### INITIALIZATION
+# ADD current_script_path TO KNOWN PATHS
+path = os_path.dirname(os_path.abspath(__file__))
+if sys_path.count(path) == 0:
+    sys_path.append(path)
+
+
+########################################################### CONFIG
+FPS_TARGET = 60
+
+########################################################### CORE
+pygame.init()
+
+# DEFAULT SETTINGS, NOTHING IS WRITTEN TO THE USER FOLDER
+settings = SettingData()
+
+# SETTING WINDOW
+WINDOW_SIZE = window_size(SCREEN_SIZE, settings)
+window = pygame.display.set_mode(WINDOW_SIZE)
+ASSETS.convert()
+
+# GAME DATA, SIMULATION CLOCK AND SCENE MANGER, NO WINDOW TO MOVE SO SETTINGS ONLY REPAINT
+game_data, simulation_clock, scene_manger = create_game(settings, SCREEN_SIZE, lambda x, y: scene_manger.invalidate())
+simulation_clock.set_speed(SPEED)
+if LOAD_SAVE:
+    load_game(game_data, simulation_clock)
+if SCENE != "main_menu":
+    scene_manger.switch_scene(SCENE)
+
+
+########################################################### MAIN LOOP
+# FIXED FRAME TIME SO EVERY RUN ENDS IN THE SAME STATE AS THE WINDOWED GAME AFTER AS MANY FRAMES
+dt = 1 / FPS_TARGET
+frames = 0
+time_update = 0
+time_draw = 0
+start = perf_counter()
+# OFFLINE TIME OF A LOADED SAVE IS ALWAYS CAUGHT UP BEFORE THE RUN ENDS
+while game_data.behind or ((simulation_clock.ticks < TICKS) if TICKS else (frames < FRAMES)):
+    pygame.event.pump()
+
+    # UPDATE
+    time_start = perf_counter()
+    simulation_clock.advance(dt)
+    scene_manger.update(dt)
+    time_update += perf_counter() - time_start
+
+    # RENDER
+    if RENDER:
+        time_start = perf_counter()
+        dirty_rects = scene_manger.draw(window)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        time_draw += perf_counter() - time_start
+
+    scene_manger.prewarm_action()
+    frames += 1
+total = perf_counter() - start
+
+
+########################################################### REPORT
+draw_stats = scene_manger.scene_current.component_manager.draw_stats()
+update_stats = scene_manger.scene_current.component_manager.update_stats()
+print("headless:")
+print(f"  scene       {scene_manger.scene_current.name}")
+print(f"  frames      {frames}")
+print(f"  ticks       {simulation_clock.ticks} at x{simulation_clock.speed:g}")
+print(f"  total       {total * 1000:8.1f} ms")
+print(f"  fps         {frames / total if total else 0:8.1f}")
+print(f"  update      {time_update * 1000 / max(frames, 1):8.3f} ms/frame")
+print(f"  draw        {time_draw * 1000 / max(frames, 1):8.3f} ms/frame")
+print(f"  blits       {draw_stats['drawn']} drawn, {draw_stats['culled']} culled last frame")
+print(f"  components  {update_stats['updated']} updated last frame, {update_stats['active']} active")
+print(f"  population  {game_data.population}")
+print(f"  food        {game_data.food}")
+for name, value in game_data.resource.items():
+    print(f"  {name:<11} {value}")
+
+
+########################################################### EXIT
+pygame.quit()
+sys_exit()
@@ -1,4 +1,8 @@
 ########################################################### IMPORTS
+# STARTUP TIMING
+from time import perf_counter
+STARTUP_START = perf_counter()
+
 # IMPORT SYS / OS
 from sys import path as sys_path
 from sys import exit as sys_exit
@@ -13,15 +17,16 @@ from pygame.locals import NOFRAME, SWSURFACE
 from scripts.DataTypes import SettingData, GameData
 
 # CUSTOM COMPONENTS
-from scripts.Tools import paths, file_settings_save, file_settings_load, file_settings_exists, file_game_save, file_game_load
-from scripts.WindowComponents import SceneManager, Sound, mp3_path
+from scripts.Tools import paths, file_settings_save, file_settings_load, file_settings_exists, file_game_save, StartupTimer, FrameScheduler
+from scripts.WindowComponents import Music, mp3_path, ASSETS
 
-# OTHER
-from tkinter import Tk
+# SHARED SETUP
+from scripts.Bootstrap import window_size, create_game, load_game
 
 
 ########################################################### ARGV
 DEV_MODE = False
+TIMING_MODE = False
 if len(argv) > 0:
     for argument in argv:
         if argument == "reset":
@@ -29,6 +34,11 @@ if len(argv) > 0:
             file_game_save(GameData().data_to_str())
         elif argument == "dev":
             DEV_MODE = True
+        elif argument == "timing":
+            TIMING_MODE = True
+
+startup_timer = StartupTimer(STARTUP_START)
+startup_timer.mark("imports")
 
 ########################################################### INITIALIZATION
 # ADD current_script_path TO KNOWN PATHS
@@ -36,39 +46,34 @@ path = os_path.dirname(os_path.abspath(__file__))
 if sys_path.count(path) == 0:
     sys_path.append(path)
 
-# GET SCREEN SIZE
-tool = Tk()
-SCREEN_SIZE = (tool.winfo_screenwidth(), tool.winfo_screenheight())
-del tool
-
 
 ########################################################### CONFIG
 FPS_TARGET = 60
+FPS_IDLE = 10
+FPS_HIDDEN = 5
+# SECONDS FROM START TO FIRST FRAME
+STARTUP_BUDGET = 1.0
 
 ########################################################### CORE
 pygame.init()
 
+# GET SCREEN SIZE
+SCREEN_SIZE = pygame.display.get_desktop_sizes()[0]
+
 # LOAD SETTINGS
 file_settings_exists()
 settings = file_settings_load()
 
 # SETTING WINDOW
-WINDOW_SIZE = (SCREEN_SIZE[0] * settings.win_size_percentage[0], SCREEN_SIZE[1] * settings.win_size_percentage[1])
+WINDOW_SIZE = window_size(SCREEN_SIZE, settings)
 environ['SDL_VIDEO_WINDOW_POS'] = '%d,%d' % (0, SCREEN_SIZE[1]-WINDOW_SIZE[1]-(SCREEN_SIZE[1]*settings.win_bottom_offset))
 window = pygame.display.set_mode(WINDOW_SIZE, NOFRAME | SWSURFACE)
+ASSETS.convert()
 
 pygame.display.set_caption("OP_Final")
 clock = pygame.time.Clock()
-
-# GAME DATA
-game_data = GameData()
-
-# SETTING SCENE MANGER
-scene_manger = SceneManager()
-scene_manger.initialize(WINDOW_SIZE, game_data)
-scene_manger.scenes["settings"].settings_link = settings
-scene_manger.scenes["settings"].window_size = WINDOW_SIZE
-scene_manger.scenes["settings"].screen_size = SCREEN_SIZE
+scheduler = FrameScheduler(FPS_TARGET, FPS_IDLE, FPS_HIDDEN)
+startup_timer.mark("display init")
 
 # TOOL FUNCTIONS
 def position_window(x, y):
@@ -78,11 +83,18 @@ def position_window(x, y):
     pygame.display.quit()
     pygame.display.init()
     window = pygame.display.set_mode(WINDOW_SIZE, NOFRAME | SWSURFACE)
-scene_manger.scenes["settings"].redraw_window = position_window
+    scene_manger.invalidate()
+
+# GAME DATA, SIMULATION CLOCK AND SCENE MANGER
+game_data, simulation_clock, scene_manger = create_game(settings, SCREEN_SIZE, position_window)
+startup_timer.mark("scene init")
+startup_timer.split("scene init", "asset load", ASSETS.load_time)
 
 
 ########################################################### MAIN LOOP
-game_data.str_to_data(file_game_load())
+# OFFLINE TIME IS CAUGHT UP A SLICE PER FRAME BY THE SIMULATION CLOCK, STARTING WITH THE FIRST
+load_game(game_data, simulation_clock)
+startup_timer.mark("save load")
 if DEV_MODE:
     scene_manger.switch_scene("game_build")
     game_data.population = 10000
@@ -97,8 +109,9 @@ if DEV_MODE:
             "steel"   : 1000000000
         }
 
-music = Sound(mp3_path("music"), 0.05)
-music.play(1000000)
+music = Music(mp3_path("music"), 0.05)
+music.play()
+startup_timer.mark("music")
 running = True
 save_interval = 100
 while running:
@@ -106,10 +119,14 @@ while running:
     for event in pygame.event.get():
         # HANDLE MOUSE EVENTS
         if event.type == pygame.MOUSEBUTTONDOWN:
+            scheduler.wake()
             scene_manger.handle_muse(event.button)
+        elif event.type == pygame.MOUSEMOTION:
+            scheduler.wake()
 
         # HANDLE KEYBOARD EVENTS
         elif event.type == pygame.KEYDOWN:
+            scheduler.wake()
             # QUITTING
             if event.key == pygame.K_ESCAPE and event.mod & pygame.KMOD_SHIFT:
                 if scene_manger.scene_current.name == "main_menu":
@@ -118,12 +135,28 @@ while running:
                     scene_manger.switch_scene("main_menu")
             elif event.key == pygame.K_ESCAPE:
                 scene_manger.back_track()
+            # PAUSING THE ECONOMY, SCENES KEEP RUNNING
+            elif event.key == pygame.K_PAUSE:
+                simulation_clock.toggle()
 
             # OTHER
             key_name = pygame.key.name(event.key)
             key_name = key_name.replace('[', '').replace(']', '')
             scene_manger.handle_key(key_name)
 
+        # HANDLE WINDOW EVENTS
+        elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            scheduler.set_hidden(True)
+            music.pause()
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+            scheduler.set_hidden(False)
+            scene_manger.invalidate()
+            music.resume()
+        elif event.type == pygame.WINDOWEXPOSED:
+            scene_manger.invalidate()
+        elif event.type in (pygame.WINDOWENTER, pygame.WINDOWFOCUSGAINED):
+            scheduler.wake()
+
         # HANDLE EVENTS
         elif event.type == pygame.QUIT:
             running = False
@@ -131,16 +164,31 @@ while running:
             break
 
     # UPDATE
+    simulation_clock.advance(clock.get_time() / 1000)
     scene_manger.update(clock.get_time() / 1000)
     save_interval += clock.get_time() / 1000
     if save_interval >= 30:
         save_interval = 0
         file_game_save(game_data.data_to_str())
 
-    # RENDER
-    scene_manger.draw(window)
-    pygame.display.flip()
-    clock.tick(FPS_TARGET)
+    # RENDER (ECONOMY KEEPS RUNNING WHILE HIDDEN)
+    dirty_rects = []
+    if scheduler.should_render():
+        dirty_rects = scene_manger.draw(window)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+    scheduler.frame(clock.get_time() / 1000, bool(dirty_rects))
+
+    if startup_timer is not None:
+        startup_timer.mark("first frame")
+        if TIMING_MODE or DEV_MODE:
+            print(startup_timer.report(STARTUP_BUDGET))
+        startup_timer = None
+
+    # BUILD LIKELY NEXT SCENES WHILE IDLE
+    scene_manger.prewarm_action()
+
+    clock.tick(scheduler.fps())
 
 
 ########################################################### EXIT
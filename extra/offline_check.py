@@ -0,0 +1,107 @@
+########################################################### IMPORTS
+# IMPORT SYS / OS
+from sys import path as sys_path
+from sys import exit as sys_exit
+from sys import argv
+from os import path as os_path
+# IMPORT RANDOM
+from random import Random
+# IMPORT TIME
+from time import perf_counter
+
+########################################################### INITIALIZATION
+# ADD THE REPOSITORY ROOT TO KNOWN PATHS
+path = os_path.dirname(os_path.dirname(os_path.abspath(__file__)))
+if sys_path.count(path) == 0:
+    sys_path.append(path)
+
+from scripts.DataTypes import GameData, OfflineProgress
+
+
+########################################################### ARGV
+# python extra/offline_check.py [saves=N] [seed=N] [budget=SECONDS]
+# CHECKS OfflineProgress AGAINST PLAIN GameData.tick ON RANDOM SAVES, RUN IT AFTER CHANGING EITHER
+SAVES = 300
+SEED = 0
+BUDGET = 0.005
+if len(argv) > 0:
+    for argument in argv[1:]:
+        name, _, value = argument.partition("=")
+        if name == "saves":
+            SAVES = int(value)
+        elif name == "seed":
+            SEED = int(value)
+        elif name == "budget":
+            BUDGET = float(value)
+
+# TICKS CAUGHT UP PER SAVE, LONG ONES ARE ONLY TIMED SINCE TICKING THEM TAKES TOO LONG
+TICKS = (1, 2, 3, 10, 57, 500, 3000, 20000)
+TICKS_TIMED = 60 * 60 * 24 * 7
+
+
+########################################################### SAVES
+def random_save(seed: int) -> GameData:
+    """small and large economies, starving or growing, with and without stock in the production chain"""
+    random = Random(seed)
+    game_data = GameData()
+    game_data.housing = random.choice([random.randint(10, 10_000), random.randint(10, 200_000)])
+    game_data.population = random.randint(0, game_data.housing)
+    game_data.food = random.choice([0, random.randint(0, 10_000), random.randint(0, 1_000_000)])
+    for production in game_data.production:
+        game_data.production[production] = [2 ** random.randint(0, 4), random.choice([random.randint(0, 60), random.randint(0, 400)])]
+    for resource in game_data.resource:
+        game_data.resource[resource] = random.choice([0, random.randint(0, 100_000)])
+    game_data.ascention = random.randint(1, 3)
+    return game_data
+
+def state(game_data: GameData) -> tuple:
+    return game_data.population, game_data.food, game_data.free_population, dict(game_data.resource), dict(game_data.stats)
+
+def run_sliced(game_data: GameData, ticks: int) -> float:
+    """catches up like SimulationClock does, a run of about BUDGET seconds at a time, returns the longest run"""
+    longest = 0
+    while ticks > 0:
+        start = perf_counter()
+        ticks -= OfflineProgress(game_data).run(ticks, BUDGET)
+        longest = max(longest, perf_counter() - start)
+    return longest
+
+
+########################################################### CHECK
+mismatches = 0
+for seed in range(SEED, SEED + SAVES):
+    ticks = TICKS[seed % len(TICKS)]
+
+    ticked = random_save(seed)
+    for _ in range(ticks):
+        ticked.tick()
+    whole = random_save(seed)
+    OfflineProgress(whole).run(ticks)
+    sliced = random_save(seed)
+    run_sliced(sliced, ticks)
+
+    expected = state(ticked)
+    for name, result in (("whole", whole), ("sliced", sliced)):
+        if state(result) != expected:
+            mismatches += 1
+            print(f"seed {seed} ticks {ticks} {name}: {state(result)[:3]} != {expected[:3]}")
+
+# TIMING OVER A WEEK AWAY
+times = []
+longest = 0
+for seed in range(SEED, SEED + SAVES):
+    start = perf_counter()
+    OfflineProgress(random_save(seed)).run(TICKS_TIMED)
+    times.append(perf_counter() - start)
+    longest = max(longest, run_sliced(random_save(seed), TICKS_TIMED))
+times.sort()
+
+
+########################################################### REPORT
+print("offline check:")
+print(f"  saves       {SAVES} from seed {SEED}")
+print(f"  mismatches  {mismatches}")
+print(f"  week whole  {times[len(times) // 2] * 1000:8.1f} ms median, {times[-1] * 1000:8.1f} ms worst")
+print(f"  week sliced {longest * 1000:8.1f} ms longest run at a budget of {BUDGET * 1000:g} ms")
+
+sys_exit(1 if mismatches else 0)
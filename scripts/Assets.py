@@ -0,0 +1,375 @@
+########################################################### IMPORTS
+# IMPORT SYS / OS
+from sys import path as sys_path
+from os import path as os_path
+
+# PYGAME
+from pygame.font import Font
+from pygame.surface import Surface
+from pygame import transform, display
+from pygame.image import load as image_load
+from pygame import mixer
+from pygame.time import get_ticks
+from pygame.locals import SRCALPHA, BLEND_RGBA_MULT
+
+# OTHER
+from collections import OrderedDict
+from time import perf_counter
+
+# PATHS
+from Tools import paths
+
+########################################################### INITIALIZATION
+# ADD current_script_path TO KNOWN PATHS
+path = os_path.dirname(os_path.abspath(__file__))
+if sys_path.count(path) == 0:
+    sys_path.append(path)
+
+
+########################################################### FONTS
+class FontCache:
+    """keeps loaded fonts keyed by (font file, size) and solves font sizes from cached metrics"""
+    def __init__(self) -> None:
+        self.fonts          : dict[tuple[str, int]:Font]    = {}
+        self.line_heights   : dict[tuple[str, int]:int]     = {}
+        self.height_sizes   : dict[tuple[str, int]:int]     = {}
+
+        self.loads: int = 0
+
+    def get(self, font_name: str, font_size: int) -> Font:
+        """returns font for given size, the file is opened only the first time"""
+        key = (font_name, font_size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = Font(os_path.join(paths.FONTS.value, font_name), font_size)
+            self.fonts[key] = font
+            self.loads += 1
+        return font
+
+    def line_height(self, font_name: str, font_size: int) -> int:
+        key = (font_name, font_size)
+        height = self.line_heights.get(key)
+        if height is None:
+            height = self.get(font_name, font_size).get_height()
+            self.line_heights[key] = height
+        return height
+
+    def size_for_height(self, height: int, font_name: str) -> int:
+        """biggest font size whose line fits into height"""
+        key = (font_name, height)
+        font_size = self.height_sizes.get(key)
+        if font_size is None:
+            font_size = self.search(lambda size: self.line_height(font_name, size) <= height)
+            self.height_sizes[key] = font_size
+        return font_size
+
+    def size_for_area(self, text: str, size: tuple[int, int], font_name: str) -> int:
+        """biggest font size for which text fits into size (w, h)"""
+        max_size = self.size_for_height(size[1], font_name)
+        return self.search(lambda font_size: self.get(font_name, font_size).size(text)[0] <= size[0], max_size)
+
+    @staticmethod
+    def search(fits: callable, upper: int = None) -> int:
+        """binary search for the biggest size that fits, never returns less than 1"""
+        low = 1
+        if upper is None:
+            # NO UPPER BOUND KNOWN -> GROW UNTIL IT OVERFLOWS
+            upper = 2
+            while fits(upper):
+                low = upper
+                upper *= 2
+        elif fits(upper):
+            return upper
+
+        # low FITS (OR IS THE MINIMUM), upper OVERFLOWS
+        while upper - low > 1:
+            middle = (low + upper) // 2
+            if fits(middle):
+                low = middle
+            else:
+                upper = middle
+        return low
+
+
+FONT_CACHE = FontCache()
+
+def surface_bytes(surface: Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+def display_format(surface: Surface) -> Surface:
+    """converts surface to the pixel format of the window so blitting it is cheap"""
+    if display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
+########################################################### SURFACE CACHES
+class SurfaceCache:
+    """LRU cache of shared surfaces, bounded by count and memory"""
+    def __init__(self, max_items: int, max_bytes: int) -> None:
+        self.surfaces   : OrderedDict[tuple:Surface] = OrderedDict()
+        self.max_items  : int = max_items
+        self.max_bytes  : int = max_bytes
+        self.bytes      : int = 0
+
+        self.hits       : int = 0
+        self.misses     : int = 0
+        self.evictions  : int = 0
+
+    def get(self, key: tuple) -> Surface:
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+        else:
+            self.misses += 1
+        return surface
+
+    def put(self, key: tuple, surface: Surface) -> Surface:
+        self.surfaces[key] = surface
+        self.bytes += surface_bytes(surface)
+        self.trim()
+        return surface
+
+    def trim(self) -> None:
+        # ALWAYS KEEP THE NEWEST ONE EVEN IF IT'S OVER BUDGET
+        while len(self.surfaces) > 1 and (len(self.surfaces) > self.max_items or self.bytes > self.max_bytes):
+            _, surface = self.surfaces.popitem(last=False)
+            self.bytes -= surface_bytes(surface)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self.surfaces.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict[str:int]:
+        return {
+            "items"    : len(self.surfaces),
+            "bytes"    : self.bytes,
+            "hits"     : self.hits,
+            "misses"   : self.misses,
+            "evictions": self.evictions
+        }
+
+class TextCache(SurfaceCache):
+    """rendered labels keyed by (text, height, font, color)"""
+    def __init__(self, max_items: int = 512, max_bytes: int = 8 * 1024 * 1024) -> None:
+        super().__init__(max_items, max_bytes)
+
+    def render(self, text: str, height: int, font_name: str, color: tuple[int, int, int]) -> Surface:
+        """returns shared label surface, callers can blit it but must never draw onto it"""
+        key = (text, height, font_name, tuple(color))
+        surface = self.get(key)
+        if surface is None:
+            font_size = FONT_CACHE.size_for_height(height, font_name)
+            surface = self.put(key, FONT_CACHE.get(font_name, font_size).render(text, True, color))
+        return surface
+
+class ImageCache(SurfaceCache):
+    """scaled, flipped and tinted image variants keyed by (source image, size, flip, color)"""
+    def __init__(self, max_items: int = 256, max_bytes: int = 64 * 1024 * 1024) -> None:
+        super().__init__(max_items, max_bytes)
+
+    def variant(self, source: any, image: Surface, size: tuple[int, int], v_flip: bool = False, color: tuple[int, int, int, int] = None) -> Surface:
+        """returns shared image variant, source is the image path (or the image itself) used as cache key"""
+        key = (source, size, v_flip, None if color is None else tuple(color))
+        surface = self.get(key)
+        if surface is None:
+            surface = transform.smoothscale(image, size)
+            if v_flip:
+                surface = transform.flip(surface, False, True)
+            if color is not None:
+                surface.fill(color, special_flags=BLEND_RGBA_MULT)
+            surface = self.put(key, display_format(surface))
+        return surface
+
+
+TEXT_CACHE = TextCache()
+IMAGE_CACHE = ImageCache()
+
+
+########################################################### GLYPH ATLAS
+class GlyphAtlas:
+    """pre-rendered glyphs for numeric labels, one set per (height, font, color)"""
+    GLYPHS: tuple[str] = ("/S", "0", "1", "2", "3", "4", "5", "6", "7", "8", "9", " ", "K", "M", "B", "T", "+", "-", "|")
+
+    def __init__(self) -> None:
+        self.atlases    : dict[tuple:dict[str:Surface]] = {}
+        self.tokens     : dict[str:list[str]]           = {}
+
+    def get(self, height: int, font_name: str, color: tuple[int, int, int]) -> dict[str:Surface]:
+        key = (height, font_name, tuple(color))
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            font = FONT_CACHE.get(font_name, FONT_CACHE.size_for_height(height, font_name))
+            atlas = {glyph: font.render(glyph, True, color) for glyph in self.GLYPHS}
+            self.atlases[key] = atlas
+        return atlas
+
+    def split(self, text: str) -> list[str]:
+        """splits text into glyphs, returns None if the atlas can't draw it"""
+        if text in self.tokens:
+            return self.tokens[text]
+
+        tokens = []
+        i = 0
+        while i < len(text):
+            for glyph in self.GLYPHS:
+                if text.startswith(glyph, i):
+                    tokens.append(glyph)
+                    i += len(glyph)
+                    break
+            else:
+                tokens = None
+                break
+
+        # NUMBERS ONLY GO BACK AND FORTH SO KEEP THIS SMALL
+        if len(self.tokens) > 1024:
+            self.tokens.clear()
+        self.tokens[text] = tokens
+        return tokens
+
+    def compose(self, text: str, height: int, font_name: str, color: tuple[int, int, int], surface: Surface = None) -> Surface:
+        """blits text glyph by glyph, reuses surface if it has the right size, returns None for unsupported text"""
+        tokens = self.split(text)
+        if tokens is None:
+            return None
+
+        atlas = self.get(height, font_name, color)
+        size = (sum(atlas[token].get_width() for token in tokens), atlas[" "].get_height())
+        if surface is None or surface.get_size() != size:
+            surface = Surface(size, SRCALPHA)
+        else:
+            surface.fill((0, 0, 0, 0))
+
+        x = 0
+        for token in tokens:
+            glyph = atlas[token]
+            surface.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        return surface
+
+
+GLYPH_ATLAS = GlyphAtlas()
+
+
+########################################################### ASSET MANAGER
+class AssetManager:
+    """loads every image file once, shares it and converts it to the display format"""
+    def __init__(self) -> None:
+        self.images     : dict[str:Surface] = {}
+        self.converted  : set[str]          = set()
+
+        self.loads: int = 0
+        self.requests: int = 0
+        self.load_time: float = 0
+
+    @staticmethod
+    def key(image_path: str) -> str:
+        return os_path.normcase(os_path.normpath(image_path))
+
+    def image(self, image_path: str) -> Surface:
+        """returns shared image, don't draw onto it"""
+        self.requests += 1
+        key = self.key(image_path)
+        image = self.images.get(key)
+        if image is None:
+            start = perf_counter()
+            image = image_load(image_path)
+            self.images[key] = image
+            self.loads += 1
+            self.load_time += perf_counter() - start
+
+        if key not in self.converted and display.get_surface() is not None:
+            start = perf_counter()
+            image = self.convert_image(key, image)
+            self.load_time += perf_counter() - start
+        return image
+
+    def convert_image(self, key: str, image: Surface) -> Surface:
+        if key.endswith(".png"):
+            image = image.convert_alpha()
+        else:
+            image = image.convert()
+        self.images[key] = image
+        self.converted.add(key)
+        return image
+
+    def convert(self) -> None:
+        """converts images loaded before the window existed, call after set_mode"""
+        for key, image in list(self.images.items()):
+            if key not in self.converted:
+                self.convert_image(key, image)
+
+    def memory(self) -> dict[str:int]:
+        """bytes used by each loaded image"""
+        return {key: surface_bytes(image) for key, image in self.images.items()}
+
+    def memory_total(self) -> int:
+        return sum(self.memory().values())
+
+
+ASSETS = AssetManager()
+
+
+########################################################### SOUND BANK
+class SoundBank:
+    """decodes every clip once and plays it on a bounded pool of reserved mixer channels"""
+    def __init__(self, max_channels: int = 8, min_interval: int = 40) -> None:
+        self.clips          : dict[str:mixer.Sound]  = {}
+        self.channels       : list[mixer.Channel]    = []
+        self.last_played    : dict[str:int]          = {}
+
+        self.max_channels   : int = max_channels
+        # MS BETWEEN TWO STARTS OF THE SAME CLIP
+        self.min_interval   : int = min_interval
+
+        self.plays      : int = 0
+        self.dropped    : int = 0
+
+    def initialize(self) -> None:
+        if not mixer.get_init():
+            mixer.init()
+        if not self.channels:
+            if mixer.get_num_channels() < self.max_channels:
+                mixer.set_num_channels(self.max_channels)
+            # RESERVED CHANNELS ARE NEVER PICKED BY pygame ON ITS OWN
+            mixer.set_reserved(self.max_channels)
+            self.channels = [mixer.Channel(i) for i in range(self.max_channels)]
+
+    def load(self, clip_path: str) -> mixer.Sound:
+        clip = self.clips.get(clip_path)
+        if clip is None:
+            self.initialize()
+            clip = mixer.Sound(clip_path)
+            self.clips[clip_path] = clip
+        return clip
+
+    def play(self, clip_path: str, volume: float = 0.7, repeat: int = 0) -> mixer.Channel:
+        """plays clip on a free pooled channel, returns None if rate limited or the pool is full"""
+        clip = self.load(clip_path)
+
+        now = get_ticks()
+        if repeat == 0 and now - self.last_played.get(clip_path, -self.min_interval) < self.min_interval:
+            self.dropped += 1
+            return None
+
+        for channel in self.channels:
+            if not channel.get_busy():
+                channel.set_volume(volume)
+                channel.play(clip, repeat)
+                self.last_played[clip_path] = now
+                self.plays += 1
+                return channel
+
+        self.dropped += 1
+        return None
+
+    def memory(self) -> dict[str:int]:
+        """bytes of decoded PCM held for each clip"""
+        frequency, sample_format, channels = mixer.get_init()
+        sample_bytes = abs(sample_format) // 8 * channels
+        return {clip_path: int(clip.get_length() * frequency) * sample_bytes for clip_path, clip in self.clips.items()}
+
+
+SOUNDS = SoundBank()
@@ -0,0 +1,58 @@
+########################################################### IMPORTS
+# IMPORT SYS / OS
+from sys import path as sys_path
+from os import path as os_path
+# IMPORT TIME
+from time import time
+
+# CUSTOM DATA TYPES
+from DataTypes import SettingData, GameData, SimulationClock
+
+# FILE TOOLS
+from Tools import file_game_load
+
+# COMPONENTS
+from WindowComponents import SceneManager, SceneSettings
+
+########################################################### INITIALIZATION
+# ADD current_script_path TO KNOWN PATHS
+path = os_path.dirname(os_path.abspath(__file__))
+if sys_path.count(path) == 0:
+    sys_path.append(path)
+
+
+########################################################### CONFIG
+# LONGEST TIME AWAY CAUGHT UP ON WHEN THE SAVE IS LOADED
+OFFLINE_LIMIT = 60 * 60 * 24 * 7
+
+########################################################### BOOTSTRAP
+# SHARED BY Main.py AND Headless.py SO BOTH RUN THE SAME GAME
+def window_size(screen_size: tuple[int, int], settings: SettingData) -> tuple[float, float]:
+    return screen_size[0] * settings.win_size_percentage[0], screen_size[1] * settings.win_size_percentage[1]
+
+def create_game(settings: SettingData, screen_size: tuple[int, int], redraw_window: callable) -> tuple[GameData, SimulationClock, SceneManager]:
+    """game data, simulation clock and scene manager, redraw_window(x, y) is called when the settings move the window"""
+    size = window_size(screen_size, settings)
+
+    game_data = GameData()
+    simulation_clock = SimulationClock(game_data)
+
+    def create_settings() -> SceneSettings:
+        scene = SceneSettings()
+        scene.settings_link = settings
+        scene.window_size = size
+        scene.screen_size = screen_size
+        scene.redraw_window = redraw_window
+        return scene
+
+    scene_manager = SceneManager()
+    scene_manager.register("settings", create_settings)
+    scene_manager.initialize(size, game_data, simulation_clock)
+    return game_data, simulation_clock, scene_manager
+
+def load_game(game_data: GameData, simulation_clock: SimulationClock) -> None:
+    """loads the user's save and queues the time since it was written, the clock catches up on it a slice per advance"""
+    game_data.str_to_data(file_game_load())
+    # A GAME QUIT WHILE PAUSED STAYED PAUSED WHILE CLOSED
+    if game_data.saved_at and not game_data.paused:
+        simulation_clock.catch_up(min(time() - game_data.saved_at, OFFLINE_LIMIT))
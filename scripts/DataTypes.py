@@ -4,6 +4,10 @@ from sys import path as sys_path
 from os import path as os_path
 # IMPORT RANDOM
 from random import random
+# IMPORT TIME
+from time import time, perf_counter
+# IMPORT MATH
+from math import ceil, gcd, inf
 
 ########################################################### INITIALIZATION
 # ADD current_script_path TO KNOWN PATHS
@@ -45,9 +49,30 @@ class SettingData:
         self.win_size_percentage = [float(data[0]), float(data[1])]
         self.win_bottom_offset = float(data[2])
 
+class ObservedDict(dict):
+    """dict that tells the GameData owning it which item changed"""
+    def __init__(self, items: dict = None, owner: 'GameData' = None, name: str = "") -> None:
+        super().__init__(items or {})
+        self.owner: GameData = owner
+        self.name : str      = name
+
+    def __setitem__(self, key: str, value: any) -> None:
+        changed = key not in self or self[key] != value
+        super().__setitem__(key, value)
+        if changed and self.owner is not None:
+            self.owner.notify(self.name, key)
+
+    def __reduce__(self):
+        # COPIES ARE PLAIN DICTS, WATCHERS STAY ON THE ORIGINAL
+        return dict, (dict(self),)
+
 class GameData:
+    # DICT FIELDS WHOSE ITEMS CAN BE WATCHED AS "resource.wood" ...
+    OBSERVED_DICTS = ("resource", "production", "stats")
+
     def __init__(self) -> None:
-        self.counting: int = 0
+        # FIELD NAME -> CALLBACKS, SET FIRST SO __setattr__ CAN USE IT
+        object.__setattr__(self, "watchers", {})
 
         self.housing         : int = 10
         self.population      : int = 10
@@ -122,10 +147,18 @@ class GameData:
         self.battle_timer = -1
         self.battle_last = -1
 
+        # UNIX TIME OF THE SAVE THIS DATA WAS LOADED FROM, 0 IF UNKNOWN
+        self.saved_at: float = 0
+        # SECONDS OF OFFLINE TIME NOT CAUGHT UP YET, SAVES DATE THEMSELVES BACK BY IT SO NONE IS LOST
+        self.behind  : int   = 0
+        # ECONOMY PAUSED BY THE PLAYER, SAVED SO A GAME QUIT WHILE PAUSED GETS NO OFFLINE PROGRESS
+        self.paused  : bool  = False
+
     def data_to_str(self) -> str:
         text = ""
 
-        text += str(self.counting) + "\n"
+        # UNUSED SLOT, WAS THE FRAME COUNTER, KEPT SO SAVES STAY COMPATIBLE
+        text += "0\n"
 
         text += str(self.housing) + "\n"
         text += str(self.population) + "\n"
@@ -198,13 +231,14 @@ class GameData:
         text += str(self.battle_timer) + "\n"
         text += str(self.battle_last) + "\n"
 
+        text += str(int(time()) - self.behind) + "\n"
+        text += str(int(self.paused)) + "\n"
+
         return text
 
     def str_to_data(self, text: str):
         if text:
             data = text.split("\n")
-            self.counting = int(data[0])
-
             self.housing = int(data[1])
             self.population = int(data[2])
             self.food = int(data[3])
@@ -278,6 +312,38 @@ class GameData:
             self.battle_timer = int(data[60])
             self.battle_last = int(data[61])
 
+            # SAVES OLDER THAN THE TIMESTAMP GET NO OFFLINE PROGRESS
+            self.saved_at = int(data[62]) if len(data) > 62 and data[62] else 0
+            self.paused = len(data) > 63 and data[63] == "1"
+
+    def __setattr__(self, name: str, value: any) -> None:
+        if name in self.OBSERVED_DICTS:
+            value = ObservedDict(value, self, name)
+            object.__setattr__(self, name, value)
+            self.notify(name, "*")
+            return
+
+        changed = self.__dict__.get(name, value) != value or name not in self.__dict__
+        object.__setattr__(self, name, value)
+        if changed:
+            self.notify(name)
+
+    def watch(self, field: str, callback: callable) -> None:
+        """callback() runs whenever field changes, field is an attribute, a dict field like "resource" or an item like "resource.wood" """
+        self.watchers.setdefault(field, []).append(callback)
+
+    def notify(self, name: str, key: str = None) -> None:
+        """key "*" means the whole dict was replaced"""
+        callbacks = list(self.watchers.get(name, []))
+        if key == "*":
+            for field, watchers in self.watchers.items():
+                if field.startswith(name + "."):
+                    callbacks += watchers
+        elif key is not None:
+            callbacks += self.watchers.get(name + "." + key, [])
+        for callback in callbacks:
+            callback()
+
     def ascention_get(self, specific: str) -> int:
         if specific == "po":
             return self.population // 50_000
@@ -296,8 +362,6 @@ class GameData:
     def ascend_now(self):
         self.ascention = self.ascention_get("all")
 
-        self.counting = 0
-
         self.housing = 10
         self.population = 10
         self.food = 100
@@ -395,73 +459,493 @@ class GameData:
     def production_build(self, name: str) -> None:
         self.production[name][1] += 1
         self.stats[name + "_build"] += 1
+        # [multiplier, count] LISTS CHANGE IN PLACE
+        self.notify("production", name)
 
     def production_upgrade(self, name: str) -> None:
         self.production[name][0] *= 2
-
-    def update(self):
-        self.counting += 1
-        if self.counting == 60:
-            self.counting = 0
-
-            if self.population < 0:
-                self.population = 0
-
-            # worker pop calc
-            self.free_population = self.population
-            for production in self.production:
-                self.free_population -= self.production_get(production)
-            effectivity = 1
-            if self.free_population < 0:
-                effectivity = self.population / (self.population - self.free_population)
-
-            # automation calc
-            for production in self.production:
-                value = int(self.production_get(production) * effectivity * self.ascention)
-                if production == "food":
-                    self.food += value
-                elif production == "steel":
-                    if self.resource_get("iron") >= value and self.resource_get("fiber") >= value:
-                        self.resource_add(production, value)
-                        self.resource_take("iron", value)
-                        self.resource_take("fiber", value)
-                elif production == "fiber":
-                    if self.resource_get("wood") >= value:
-                        self.resource_add(production, value)
-                        self.resource_take("wood", value)
-                elif production == "iron":
-                    if self.resource_get("stone") >= value:
-                        self.resource_add(production, value)
-                        self.resource_take("stone", value)
-                else:
+        self.notify("production", name)
+
+    def production_values(self) -> dict[str:int]:
+        """amount every production makes in one tick, also updates free_population"""
+        self.free_population, values = self.production_split(self.population)
+        return values
+
+    def production_split(self, population: int) -> tuple[int, dict[str:int]]:
+        """free population and amount every production makes in one tick at population, changes nothing"""
+        population = max(population, 0)
+
+        # worker pop calc
+        free_population = population
+        for production in self.production:
+            free_population -= self.production_get(production)
+        effectivity = 1
+        if free_population < 0:
+            effectivity = population / (population - free_population)
+
+        values = {}
+        for production in self.production:
+            values[production] = int(self.production_get(production) * effectivity * self.ascention)
+        return free_population, values
+
+    def tick(self):
+        """advances the economy by one second"""
+        if self.population < 0:
+            self.population = 0
+
+        # automation calc
+        for production, value in self.production_values().items():
+            if production == "food":
+                self.food += value
+            elif production == "steel":
+                if self.resource_get("iron") >= value and self.resource_get("fiber") >= value:
                     self.resource_add(production, value)
-
-            # food calc
-            if self.food >= self.population * 0.1:
-                self.food = max(int(round(self.food - (self.population * 0.1))), 0)
-                # pop growth calc
-                if self.housing > self.population:
-                    self.population = min(int(round(self.population * 1.1)), self.housing)
+                    self.resource_take("iron", value)
+                    self.resource_take("fiber", value)
+            elif production == "fiber":
+                if self.resource_get("wood") >= value:
+                    self.resource_add(production, value)
+                    self.resource_take("wood", value)
+            elif production == "iron":
+                if self.resource_get("stone") >= value:
+                    self.resource_add(production, value)
+                    self.resource_take("stone", value)
             else:
-                self.food = 0
-                self.population = max(int(round(self.population * 0.9)), 0)
-
-            # timers
-            if self.battle_timer != -1:
-                self.battle_timer -= 1
-                if self.battle_timer == 0:
-                    self.battle_timer = -1
-                    if random() < self.battle_current_chance:
-                        self.resource_add("kills", self.battle_targets)
-                        self.battle_targets *= 2
-                        self.battle_last = 1
-                    else:
-                        self.population -= self.battle_targets * 10
-                        self.battle_last = 0
+                self.resource_add(production, value)
+
+        # food calc
+        if self.food >= self.population * 0.1:
+            self.food = max(int(round(self.food - (self.population * 0.1))), 0)
+            # pop growth calc
+            if self.housing > self.population:
+                self.population = min(int(round(self.population * 1.1)), self.housing)
+        else:
+            self.food = 0
+            self.population = max(int(round(self.population * 0.9)), 0)
+
+        # timers
+        if self.battle_timer != -1:
+            self.battle_timer -= 1
+            if self.battle_timer == 0:
+                self.battle_timer = -1
+                if random() < self.battle_current_chance:
+                    self.resource_add("kills", self.battle_targets)
+                    self.battle_targets *= 2
+                    self.battle_last = 1
+                else:
+                    self.population -= self.battle_targets * 10
+                    self.battle_last = 0
+
+class SimulationClock:
+    """advances GameData in fixed real time ticks independent of frame rate and scene"""
+    def __init__(self, game_data: GameData, tick_length: float = 1.0, max_ticks: int = 60, catch_up_budget: float = 0.005) -> None:
+        self.game_data  : GameData  = game_data
+        self.tick_length: float     = tick_length
+        # TICKS ONE advance CAN CATCH UP, LONGER GAPS ARE DROPPED
+        self.max_ticks  : int       = max_ticks
+        # SECONDS OF WORK ONE advance SPENDS ON OFFLINE TIME IN game_data.behind
+        self.catch_up_budget: float = catch_up_budget
+
+        self.accumulator: float = 0
+        # LIVE TICKS, ONES QUEUED BEHIND OFFLINE TIME INCLUDED
+        self.ticks      : int   = 0
+        # SIMULATED SECONDS PER REAL SECOND, WHILE game_data.paused advance IS IGNORED
+        self.speed      : float = 1.0
+
+    def pause(self) -> None:
+        self.game_data.paused = True
+
+    def resume(self) -> None:
+        self.game_data.paused = False
+
+    def toggle(self) -> None:
+        self.game_data.paused = not self.game_data.paused
+
+    def set_speed(self, speed: float) -> None:
+        """speed multiplier, 2 runs two ticks per tick_length of real time"""
+        self.speed = max(speed, 0)
+
+    def catch_up(self, seconds: float) -> None:
+        """queues time spent closed, advance works it off through OfflineProgress so no single frame waits for all of it"""
+        self.game_data.behind += max(int(seconds), 0)
+
+    def advance(self, dt: float) -> int:
+        """adds dt seconds, runs every whole tick that fits and returns how many ran"""
+        if self.game_data.paused:
+            return 0
+        # CATCH UP LIMIT GROWS WITH speed SO FAST CLOCKS DON'T LOSE TICKS EVERY FRAME
+        self.accumulator = min(self.accumulator + dt * self.speed, self.tick_length * self.max_ticks * max(self.speed, 1))
+
+        ticks = 0
+        while self.accumulator >= self.tick_length:
+            self.accumulator -= self.tick_length
+            self.ticks += 1
+            # LIVE TICKS QUEUE BEHIND OFFLINE TIME SO EVERY TICK STILL RUNS IN ORDER
+            if self.game_data.behind:
+                self.game_data.behind += 1
+            else:
+                self.game_data.tick()
+                ticks += 1
+
+        if self.game_data.behind:
+            caught_up = OfflineProgress(self.game_data).run(self.game_data.behind, self.catch_up_budget)
+            self.game_data.behind -= caught_up
+            ticks += caught_up
+        return ticks
+
+class OfflineProgress:
+    """fast forwards GameData over time spent closed, in segments of equal production that are each solved in one step"""
+    # RESOURCES OF THE PRODUCTION CHAIN, IN THE ORDER GameData.tick MAKES THEM
+    CHAIN = ("wood", "stone", "fiber", "iron", "steel", "elements")
+    # INDEX IN CHAIN OF THE LEVEL EVERY CHECK OF A TICK LOOKS AT: WOOD FOR FIBER, STONE FOR IRON, IRON AND FIBER FOR STEEL
+    CHECKED = (0, 1, 3, 2)
+
+    def __init__(self, game_data: GameData, max_steps: int = 1 << 15) -> None:
+        self.game_data: GameData = game_data
+        # MOST SINGLE TICKS ONE SEGMENT REMEMBERS WHILE LOOKING FOR A REPEATING POPULATION
+        self.max_steps: int      = max_steps
+        # FEWEST TICKS OF EVEN FOOD CHANGE JUMPED IN ONE STEP
+        self.min_jump : int      = 16
+        # perf_counter TIME run STOPS AT, THE TICKS LEFT ARE FOR THE NEXT run
+        self.deadline : float    = inf
+
+        # POPULATION -> AMOUNT EVERY PRODUCTION MAKES IN ONE TICK
+        self.made: dict[int:dict[str:int]] = {}
+
+        self.ticks_simulated: int = 0
+        self.ticks_skipped  : int = 0
+
+    def run(self, seconds: float, budget: float = inf) -> int:
+        """advances the economy by every whole second in seconds, stopping early after about budget seconds of work, returns the ticks done"""
+        game_data = self.game_data
+        remaining = max(int(seconds), 0)
+        self.deadline = perf_counter() + budget
+
+        done = 0
+        while done < remaining and (done == 0 or perf_counter() < self.deadline):
+            # BATTLES END ON A RANDOM ROLL SO THEY ARE ALWAYS TICKED
+            if game_data.battle_timer != -1:
+                game_data.tick()
+                self.ticks_simulated += 1
+                done += 1
+            else:
+                done += self.segment(remaining - done)
+
+        return done
+
+    def segment(self, remaining: int) -> int:
+        """steps population and food one tick at a time until they settle or repeat, then jumps, returns the ticks done"""
+        game_data = self.game_data
+        # POPULATION AND FOOD NEVER DEPEND ON THE RESOURCES, SO THEY ARE STEPPED ALONE AND THE RESOURCES FOLLOW IN RUNS
+        state = (max(game_data.population, 0), game_data.food)
+        limit = min(remaining, self.max_steps)
+
+        # (population, food) BEFORE EVERY SINGLE TICK
+        steps = []
+        seen = {}
+        linear = (0, 0)
+        while len(steps) < limit and state not in seen:
+            if steps and perf_counter() > self.deadline:
+                break
+            after = self.step(*state)
+            linear = self.linear(*state, after, remaining - len(steps))
+            # SHORT RUNS ARE STEPPED SO THEY DON'T CUT A LOOP THEY ARE PART OF INTO SEGMENTS
+            if linear[0] >= self.min_jump:
+                break
+            linear = (0, 0)
+            seen[state] = len(steps)
+            steps.append(state)
+            state = after
+
+        self.produce_runs(self.runs([population for population, food in steps]))
+        self.ticks_simulated += len(steps)
+        done = len(steps)
+        last = steps[-1][0] if steps else None
+
+        if linear[0]:
+            # POPULATION STAYS, FOOD CHANGES BY THE SAME AMOUNT EVERY TICK UNTIL IT RUNS LOW OR CROSSES A POWER OF TWO
+            ticks, change = linear
+            population, food = state
+            self.produce(self.values(population), ticks)
+            state = (population, food + ticks * change)
+            last = population
+            self.ticks_skipped += ticks
+            done += ticks
+        elif done < remaining and state in seen:
+            # STARVING POPULATIONS SETTLE INTO A LOOP OF GROWING AND SHRINKING, IT IS REPEATED TO THE END
+            cycle = steps[seen[state]:]
+            ticks = remaining - done
+            runs = self.runs([population for population, food in cycle])
+            if len(runs) == 1:
+                self.produce(runs[0][0], ticks)
+            else:
+                ticks = self.repeat([self.values(population) for population, food in cycle], ticks)
+            rest = ticks % len(cycle)
+            state = cycle[rest]
+            last = cycle[rest - 1][0]
+            self.ticks_skipped += ticks
+            done += ticks
+
+        game_data.population, game_data.food = state
+        if last is not None:
+            game_data.free_population = game_data.production_split(last)[0]
+        return done
+
+    def values(self, population: int) -> dict[str:int]:
+        made = self.made.get(population)
+        if made is None:
+            made = self.made[population] = self.game_data.production_split(population)[1]
+        return made
+
+    def step(self, population: int, food: int) -> tuple[int, int]:
+        """population and food after one tick, same rules as GameData.tick"""
+        population = max(population, 0)
+        food += self.values(population)["food"]
+        if food >= population * 0.1:
+            food = max(int(round(food - (population * 0.1))), 0)
+            if self.game_data.housing > population:
+                population = min(int(round(population * 1.1)), self.game_data.housing)
+        else:
+            food = 0
+            population = max(int(round(population * 0.9)), 0)
+        return population, food
+
+    def linear(self, population: int, food: int, after: tuple[int, int], ticks: int) -> tuple[int, int]:
+        """(ticks, food change per tick) for which population stays and food changes evenly, at most ticks, (0, 0) if not"""
+        if after[0] != population:
+            return 0, 0
+        change = after[1] - food
+        if self.step(*after) != (population, after[1] + change):
+            return 0, 0
+
+        # food - population * 0.1 IS A FLOAT, ITS ROUNDING ONLY STAYS THE SAME WHILE THE RESULT KEEPS ITS POWER OF TWO
+        rest = food + self.values(population)["food"] - ceil(population * 0.1)
+        bits = rest.bit_length()
+        if rest < 1 or bits > 52 or (rest + 1).bit_length() != bits:
+            return 0, 0
+        if change > 0:
+            ticks = min(ticks, ((1 << bits) - 2 - rest) // change + 1)
+        elif change < 0:
+            ticks = min(ticks, (rest - (1 << (bits - 1))) // -change + 1)
+        return ticks, change
+
+    def runs(self, populations: list[int]) -> list[list]:
+        """[production, ticks] for every run of ticks that make the same amounts"""
+        runs = []
+        for population in populations:
+            made = self.values(population)
+            if runs and (runs[-1][0] is made or runs[-1][0] == made):
+                runs[-1][1] += 1
+            else:
+                runs.append([made, 1])
+        return runs
+
+    def produce_runs(self, runs: list[list]) -> None:
+        for made, ticks in runs:
+            self.produce(made, ticks)
+
+    def produce(self, made: dict[str:int], ticks: int) -> None:
+        """applies ticks ticks of the resource chain making made every tick"""
+        resource = self.game_data.resource
+        stats = self.game_data.stats
+
+        fibers = self.converted(resource["wood"], made["wood"], made["fiber"], ticks)
+        irons = self.converted(resource["stone"], made["stone"], made["iron"], ticks)
+        steels = ticks
+        if made["steel"]:
+            # STEEL RUNS WHEN BOTH ITS INPUTS HOLD ENOUGH, SO THE TICK ONE OF THEM IS LOWEST ON LIMITS IT
+            lowest = min(
+                self.lowest(resource["fiber"], resource["wood"], made["wood"], made["fiber"], made["steel"], ticks),
+                self.lowest(resource["iron"], resource["stone"], made["stone"], made["iron"], made["steel"], ticks)
+            )
+            steels = min(ticks, ticks + lowest)
+
+        resource["wood"] += ticks * made["wood"] - fibers * made["fiber"]
+        resource["stone"] += ticks * made["stone"] - irons * made["iron"]
+        resource["fiber"] += fibers * made["fiber"] - steels * made["steel"]
+        resource["iron"] += irons * made["iron"] - steels * made["steel"]
+        resource["steel"] += steels * made["steel"]
+        resource["elements"] += ticks * made["elements"]
+
+        stats["wood_gathered"] += ticks * made["wood"]
+        stats["stone_gathered"] += ticks * made["stone"]
+        stats["fiber_gathered"] += fibers * made["fiber"]
+        stats["iron_gathered"] += irons * made["iron"]
+        stats["steel_gathered"] += steels * made["steel"]
+        stats["elements_gathered"] += ticks * made["elements"]
+
+    def repeat(self, cycle: list[dict[str:int]], ticks: int) -> int:
+        """applies up to ticks ticks of the resource chain while production loops through cycle, returns the ticks applied"""
+        game_data = self.game_data
+        made = [tuple(values[name] for name in self.CHAIN) for values in cycle]
+        levels = [game_data.resource[name] for name in self.CHAIN]
+        gathered = [0] * len(self.CHAIN)
+        cycles, rest = divmod(ticks, len(cycle))
+
+        # SPANS OF CYCLES ARE MEASURED FROM AN ANCHOR THAT MOVES AFTER 1, 2, 4 ... CYCLES
+        anchor = None
+        length = 0
+        power = 1
+        done = 0
+        while done < cycles:
+            # OUT OF TIME, THE CYCLES LEFT ARE DONE BY THE NEXT run
+            if done and perf_counter() > self.deadline:
+                cycles = done
+                rest = 0
+                break
+            if anchor is None:
+                anchor = (levels[:], gathered[:])
+                length = 0
+                # CLOSEST EVERY CHECK CAME TO FLIPPING SINCE THE ANCHOR AS [passed, failed]
+                slack = [[inf, inf] for _ in self.CHECKED]
+            self.chain(levels, gathered, made, slack)
+            done += 1
+            length += 1
+
+            # THE SPAN SINCE THE ANCHOR CAN BE REPEATED AS LONG AS EVERY CHECK IN IT COMES OUT THE SAME
+            change = [level - start for level, start in zip(levels, anchor[0])]
+            repeats = (cycles - done) // length
+            for index, (passed, failed) in zip(self.CHECKED, slack):
+                if change[index] < 0 and passed != inf:
+                    repeats = min(repeats, passed // -change[index])
+                elif change[index] > 0 and failed != inf:
+                    repeats = min(repeats, (failed - 1) // change[index])
+
+            if repeats > 0:
+                for index, start in enumerate(anchor[1]):
+                    gathered[index] += (gathered[index] - start) * repeats
+                for index, step in enumerate(change):
+                    levels[index] += step * repeats
+                done += length * repeats
+                anchor = None
+                power = 1
+            elif length == power:
+                anchor = None
+                power = min(power * 2, self.max_steps)
+
+        self.chain(levels, gathered, made[:rest], [[inf, inf] for _ in self.CHECKED])
+        for name, level, amount in zip(self.CHAIN, levels, gathered):
+            game_data.resource[name] = level
+            game_data.stats[name + "_gathered"] += amount
+        return cycles * len(cycle) + rest
+
+    @staticmethod
+    def chain(levels: list[int], gathered: list[int], made: list[tuple], slack: list[list[int]]) -> None:
+        """ticks the resource chain once for every entry of made, updates levels, gathered and slack in place"""
+        wood, stone, fiber, iron, steel, elements = levels
+        wood_made, stone_made, fiber_made, iron_made, steel_made, elements_made = 0, 0, 0, 0, 0, 0
+        wood_slack, stone_slack, iron_slack, fiber_slack = slack
+        for wood_step, stone_step, fiber_step, iron_step, steel_step, elements_step in made:
+            wood += wood_step
+            stone += stone_step
+            wood_made += wood_step
+            stone_made += stone_step
+
+            margin = wood - fiber_step
+            if margin >= 0:
+                wood_slack[0] = min(wood_slack[0], margin)
+                wood -= fiber_step
+                fiber += fiber_step
+                fiber_made += fiber_step
+            else:
+                wood_slack[1] = min(wood_slack[1], -margin)
+
+            margin = stone - iron_step
+            if margin >= 0:
+                stone_slack[0] = min(stone_slack[0], margin)
+                stone -= iron_step
+                iron += iron_step
+                iron_made += iron_step
+            else:
+                stone_slack[1] = min(stone_slack[1], -margin)
 
+            iron_margin = iron - steel_step
+            fiber_margin = fiber - steel_step
+            if iron_margin >= 0:
+                iron_slack[0] = min(iron_slack[0], iron_margin)
+            else:
+                iron_slack[1] = min(iron_slack[1], -iron_margin)
+            if fiber_margin >= 0:
+                fiber_slack[0] = min(fiber_slack[0], fiber_margin)
+            else:
+                fiber_slack[1] = min(fiber_slack[1], -fiber_margin)
+            if iron_margin >= 0 and fiber_margin >= 0:
+                iron -= steel_step
+                fiber -= steel_step
+                steel += steel_step
+                steel_made += steel_step
+
+            elements += elements_step
+            elements_made += elements_step
+
+        levels[:] = [wood, stone, fiber, iron, steel, elements]
+        for index, amount in enumerate((wood_made, stone_made, fiber_made, iron_made, steel_made, elements_made)):
+            gathered[index] += amount
+
+    @staticmethod
+    def converted(source: int, supply: int, size: int, ticks: int) -> int:
+        """times a conversion taking size from source runs in ticks ticks, supply is added to source before every check"""
+        # RUNS ON TICK t UNLESS IT ALREADY RAN AS OFTEN AS (source + t * supply) // size ALLOWS
+        if size == 0:
+            return ticks
+        return min(ticks, (source + ticks * supply) // size, (source + supply) // size + ticks - 1)
+
+    @classmethod
+    def lowest(cls, level: int, source: int, supply: int, size: int, need: int, ticks: int) -> int:
+        """lowest (level + size * converted(source, supply, size, t)) // need - t for t from 1 to ticks"""
+        def margin(t: int) -> int:
+            return (level + size * cls.converted(source, supply, size, t)) // need - t
+
+        points = {1, ticks}
+        if size and supply < size:
+            # CONVERTS EVERY TICK UNTIL source IS DRAINED, AFTER THAT margin STAYS WITHIN (size + need) / need OF A LINE
+            drained = source // (size - supply)
+            points.add(max(min(drained, ticks), 1))
+            first = max(drained + 1, 1)
+            if first <= ticks:
+                points.add(first)
+                # SO ITS LOWEST POINT IS CLOSE TO THE END THE LINE FALLS TOWARDS, OR ANYWHERE IN ONE PERIOD IF IT IS FLAT
+                if supply < need:
+                    span = -(-(size + need) // (need - supply))
+                    points.update(range(max(first, ticks - span), ticks + 1))
+                elif supply > need:
+                    span = -(-(size + need) // (supply - need))
+                    points.update(range(first, min(ticks, first + span) + 1))
+                else:
+                    points.update(range(first, min(ticks, first + size // gcd(supply, size)) + 1))
+        return min(margin(t) for t in points)
 
 
 class Emit:
     def __init__(self, name: str, data: list[any]) -> None:
         self.name: str       = name
-        self.data: list[any] = data
\ No newline at end of file
+        self.data: list[any] = data
+
+class EventBus:
+    """routes Emit to the handlers registered for its name, counts and times every event"""
+    def __init__(self) -> None:
+        self.handlers: dict[str:list[callable]] = {}
+
+        self.counts: dict[str:int]   = {}
+        self.times : dict[str:float] = {}
+
+    def register(self, name: str, handler: callable) -> None:
+        """handler is called with the Emit, handlers of one name run in the order they were registered"""
+        self.handlers.setdefault(name, []).append(handler)
+
+    def dispatch(self, emit: Emit) -> bool:
+        """returns False when nothing handles the event"""
+        self.counts[emit.name] = self.counts.get(emit.name, 0) + 1
+        handlers = self.handlers.get(emit.name)
+        if handlers is None:
+            return False
+
+        start = perf_counter()
+        for handler in handlers:
+            handler(emit)
+        self.times[emit.name] = self.times.get(emit.name, 0) + perf_counter() - start
+        return True
+
+    def stats(self) -> dict[str:tuple[int, float]]:
+        """(times dispatched, seconds spent in handlers) per event name"""
+        return {name: (count, self.times.get(name, 0)) for name, count in self.counts.items()}
\ No newline at end of file
@@ -3,13 +3,14 @@
 import sys
 from sys import path as sys_path
 from os import path as os_path
-from os import makedirs
+from os import makedirs, environ
 
 # CUSTOM DATA TYPES
 from DataTypes import SettingData
 
 # OTHER
 from enum import Enum
+from time import perf_counter
 
 
 ########################################################### INITIALIZATION
@@ -29,16 +30,22 @@ def resource_path(relative_path):
     return os_path.join(base_path, relative_path)
 
 def persistent_path(relative_path):
+    """per user data folder, %LOCALAPPDATA% on windows, ~/Library/Application Support on mac, $XDG_DATA_HOME elsewhere"""
     home_directory = os_path.expanduser("~")
-    persistent_directory = home_directory + r"\AppData\Local\ElementalVillage" + "\\" + relative_path
-    return persistent_directory
+    if sys.platform == "win32":
+        data_directory = environ.get("LOCALAPPDATA") or os_path.join(home_directory, "AppData", "Local")
+    elif sys.platform == "darwin":
+        data_directory = os_path.join(home_directory, "Library", "Application Support")
+    else:
+        data_directory = environ.get("XDG_DATA_HOME") or os_path.join(home_directory, ".local", "share")
+    return os_path.join(data_directory, "ElementalVillage", relative_path)
 
 class paths(Enum):
-    SETTINGS = persistent_path(r"user\settings.txt")
-    IMAGES = resource_path(r"resources\images")
-    FONTS = resource_path(r"resources\fonts")
-    GAME = persistent_path(r"user\save.txt")
-    SOUND = resource_path(r"resources\sound")
+    SETTINGS = persistent_path(os_path.join("user", "settings.txt"))
+    IMAGES = resource_path(os_path.join("resources", "images"))
+    FONTS = resource_path(os_path.join("resources", "fonts"))
+    GAME = persistent_path(os_path.join("user", "save.txt"))
+    SOUND = resource_path(os_path.join("resources", "sound"))
 
 def file_settings_save(data: SettingData) -> None:
     """saves settings into file"""
@@ -54,7 +61,7 @@ def file_settings_load() -> SettingData:
 
 def file_settings_exists() -> None:
     if not os_path.exists(paths.SETTINGS.value):
-        makedirs(persistent_path(r"\user"))
+        makedirs(persistent_path("user"), exist_ok=True)
         file_settings_save(SettingData())
 
 def file_game_save(text: str):
@@ -70,4 +77,189 @@ def file_game_load() -> str:
     except FileNotFoundError:
         output = ""
 
-    return output
\ No newline at end of file
+    return output
+
+########################################################### TIMING
+class StartupTimer:
+    """measures time spent in each startup phase"""
+    def __init__(self, start: float = None) -> None:
+        self.start  : float             = perf_counter() if start is None else start
+        self.last   : float             = self.start
+        self.phases : dict[str:float]   = {}
+
+    def mark(self, phase: str) -> None:
+        """adds time since the last mark to phase"""
+        now = perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0) + now - self.last
+        self.last = now
+
+    def split(self, phase: str, new_phase: str, seconds: float) -> None:
+        """moves seconds measured inside phase to new_phase"""
+        seconds = min(seconds, self.phases.get(phase, 0))
+        self.phases[phase] = self.phases.get(phase, 0) - seconds
+        self.phases[new_phase] = self.phases.get(new_phase, 0) + seconds
+
+    def total(self) -> float:
+        return self.last - self.start
+
+    def report(self, budget: float = None) -> str:
+        lines = ["startup:"]
+        for phase, seconds in self.phases.items():
+            lines.append("  %-12s %7.1f ms" % (phase, seconds * 1000))
+        lines.append("  %-12s %7.1f ms" % ("total", self.total() * 1000))
+        if budget is not None:
+            lines.append("  %-12s %7.1f ms %s" % ("budget", budget * 1000, "OK" if self.total() <= budget else "OVER"))
+        return "\n".join(lines)
+
+class FrameScheduler:
+    """picks the tick rate of the next frame, full rate while something happens and low rate when idle"""
+    def __init__(self, fps_active: int = 60, fps_idle: int = 10, fps_hidden: int = 5, idle_delay: float = 1.0) -> None:
+        self.fps_active : int   = fps_active
+        self.fps_idle   : int   = fps_idle
+        self.fps_hidden : int   = fps_hidden
+        # SECONDS WITHOUT INPUT OR ANIMATION BEFORE DROPPING TO fps_idle
+        self.idle_delay : float = idle_delay
+
+        self.idle_time      : float = 0
+        self.hidden         : bool  = False
+        self.changed_last   : bool  = False
+
+    def wake(self) -> None:
+        """input arrived, run at full rate"""
+        self.idle_time = 0
+
+    def set_hidden(self, hidden: bool) -> None:
+        self.hidden = hidden
+        self.idle_time = 0
+
+    def should_render(self) -> bool:
+        return not self.hidden
+
+    def frame(self, dt: float, changed: bool) -> None:
+        """changed tells if the last frame redrew anything, two changed frames in a row count as animation"""
+        if changed and self.changed_last:
+            self.idle_time = 0
+        else:
+            self.idle_time += dt
+        self.changed_last = changed
+
+    def fps(self) -> int:
+        if self.hidden:
+            return self.fps_hidden
+        if self.idle_time >= self.idle_delay:
+            return self.fps_idle
+        return self.fps_active
+
+
+########################################################### SPATIAL
+class SpatialGrid:
+    """uniform grid of cell_size squares, finds items whose rect covers a point without testing every item"""
+    def __init__(self, cell_size: int = 64) -> None:
+        self.cell_size: int = cell_size
+
+        self.cells: dict[tuple[int, int]:list] = {}
+        # ITEM -> (rect, cells it lies in)
+        self.items: dict[any:tuple] = {}
+        # ITEM -> NUMBER IT WAS ADDED AS, QUERIES KEEP THIS ORDER
+        self.order: dict[any:int] = {}
+
+    def add(self, item: any) -> None:
+        """registers item, it can be found once it is given a rect by move"""
+        if item not in self.order:
+            self.order[item] = len(self.order)
+
+    def move(self, item: any, rect: tuple[int, int, int, int]) -> None:
+        rect = tuple(rect)
+        old = self.items.get(item)
+        if old is not None:
+            if old[0] == rect:
+                return
+            for cell in old[1]:
+                self.cells[cell].remove(item)
+
+        x, y, w, h = rect
+        size = self.cell_size
+        cells = [(cx, cy) for cx in range(x // size, (x + w) // size + 1) for cy in range(y // size, (y + h) // size + 1)]
+        for cell in cells:
+            self.cells.setdefault(cell, []).append(item)
+        self.items[item] = (rect, cells)
+
+    def remove(self, item: any) -> None:
+        old = self.items.pop(item, None)
+        if old is not None:
+            for cell in old[1]:
+                self.cells[cell].remove(item)
+        self.order.pop(item, None)
+
+    def query(self, point: tuple[int, int]) -> list:
+        """items in the cell of point, callers still test the exact rect"""
+        items = self.cells.get((point[0] // self.cell_size, point[1] // self.cell_size), [])
+        return sorted(items, key=self.order.__getitem__)
+
+
+########################################################### ANIMATION
+def ease_linear(t: float) -> float:
+    return t
+
+def ease_in(t: float) -> float:
+    """starts slow and speeds up"""
+    return t * t * t
+
+def ease_out(t: float) -> float:
+    """starts fast and slows down"""
+    return 1 - (1 - t) ** 3
+
+class Tween:
+    """moves a number or a tuple of numbers from start to end in duration seconds, apply(value) is called every step"""
+    def __init__(self, start: any, end: any, duration: float, apply: callable, ease: callable = ease_linear, on_done: callable = None) -> None:
+        self.start      : any       = start
+        self.end        : any       = end
+        self.duration   : float     = duration
+        self.apply      : callable  = apply
+        self.ease       : callable  = ease
+        self.on_done    : callable  = on_done
+
+        self.elapsed    : float     = 0
+
+    def value(self, t: float) -> any:
+        if isinstance(self.start, (tuple, list)):
+            return tuple(start + (end - start) * t for start, end in zip(self.start, self.end))
+        return self.start + (self.end - self.start) * t
+
+    def step(self, dt: float) -> bool:
+        """returns True once end was applied"""
+        self.elapsed = min(self.elapsed + dt, self.duration)
+        self.apply(self.value(self.ease(self.elapsed / self.duration if self.duration > 0 else 1)))
+        return self.elapsed >= self.duration
+
+class TweenManager:
+    """steps running tweens, finished ones are dropped so only live animations cost time"""
+    def __init__(self, max_step: float = 0.1) -> None:
+        self.tweens     : dict[any:Tween] = {}
+        # LONGEST dt ONE UPDATE ADVANCES, A HITCH SLOWS AN ANIMATION INSTEAD OF SKIPPING IT
+        self.max_step   : float = max_step
+
+    def add(self, key: any, tween: Tween) -> Tween:
+        """a tween already running under key is replaced"""
+        self.tweens[key] = tween
+        return tween
+
+    def cancel(self, key: any) -> None:
+        self.tweens.pop(key, None)
+
+    def running(self, key: any) -> bool:
+        return key in self.tweens
+
+    def update(self, dt: float) -> None:
+        dt = min(dt, self.max_step)
+        for key, tween in list(self.tweens.items()):
+            # A CALLBACK EARLIER IN THIS LOOP MAY HAVE CANCELED OR REPLACED IT
+            if self.tweens.get(key) is not tween:
+                continue
+            if tween.step(dt):
+                del self.tweens[key]
+                if tween.on_done is not None:
+                    tween.on_done()
+
+    def __len__(self) -> int:
+        return len(self.tweens)
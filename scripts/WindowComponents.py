@@ -6,12 +6,12 @@ from os import path as os_path
 import pygame.event
 # PYGAME
 from pygame.surface import Surface
-from pygame.image import load as image_load
+from pygame.rect import Rect
 from pygame import transform
-from pygame.locals import SRCALPHA, HWSURFACE, SRCALPHA
+from pygame.locals import SRCALPHA, HWSURFACE, SRCALPHA, BLEND_RGB_MULT, BLEND_RGB_ADD, BLEND_PREMULTIPLIED
 
 # CUSTOM DATA TYPES
-from DataTypes import Emit, GameData
+from DataTypes import Emit, EventBus, GameData, SimulationClock
 
 # FILE TOOLS
 from Tools import file_settings_save
@@ -19,8 +19,14 @@ from Tools import file_settings_save
 # PATHS
 from Tools import paths
 
-# RANDOM
-from random import randint
+# HIT TESTING
+from Tools import SpatialGrid
+
+# ANIMATION
+from Tools import Tween, TweenManager, ease_linear, ease_in, ease_out
+
+# ASSETS
+from Assets import FONT_CACHE, TEXT_CACHE, IMAGE_CACHE, GLYPH_ATLAS, ASSETS, SOUNDS
 
 ########################################################### INITIALIZATION
 # ADD current_script_path TO KNOWN PATHS
@@ -30,16 +36,17 @@ if sys_path.count(path) == 0:
 
 
 ########################################################### VARIABLES
-TEXT_FONT = "/excluded.ttf"
-BUTTON_FONT = "/deep_shadow.ttf"
-LOGO_FONT = "/fast_forward.ttf"
+TEXT_FONT = "excluded.ttf"
+BUTTON_FONT = "deep_shadow.ttf"
+LOGO_FONT = "fast_forward.ttf"
 
 ########################################################### TOOLS
 def img_path(name: str) -> str:
-    return paths.IMAGES.value+"/"+name
+    """name separates folders with /, e.g. Icons/ico_wood.png"""
+    return os_path.join(paths.IMAGES.value, *name.split("/"))
 
 def mp3_path(name: str) -> str:
-    return paths.SOUND.value+"/"+name+".mp3"
+    return os_path.join(paths.SOUND.value, name + ".mp3")
 
 def int_smart_str(number: int) -> str:
     if number < 1000:
@@ -53,64 +60,95 @@ def int_smart_str(number: int) -> str:
     elif number < 1000000000000000:
         return str(number//1000000000000) + " T"
 
+def merge_rects(rects: list[Rect]) -> list[Rect]:
+    """merges overlapping rects so no area gets redrawn twice"""
+    merged = []
+    for rect in rects:
+        i = 0
+        while i < len(merged):
+            if rect.colliderect(merged[i]):
+                rect = rect.union(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
 def component_shop_update_cost(comp: any, factor: float) -> None:
     x, y = comp.get_cost()
     comp.change_cost((x * factor, y * factor))
 
 def generate_text_with_area_size(text: str, size: tuple[int, int], font_name: str, text_color: tuple[int, int, int] = (255, 255, 255)) -> Surface:
-    font_size = 1
-    while True:
-        font = pygame.font.Font(paths.FONTS.value + font_name, font_size)
-        text_surface = font.render(text, True, (255, 255, 255))
-        text_width, text_height = text_surface.get_size()
-
-        if text_width > size[0] or text_height > size[1]:
-            font_size -= 1
-            break
-        font_size += 1
-
-    return font.render(text, True, text_color)
+    font_size = FONT_CACHE.size_for_area(text, size, font_name)
+    return FONT_CACHE.get(font_name, font_size).render(text, True, text_color)
 
 def generate_text_with_font_size(text: str, font_size: int, font_name: str,  text_color: tuple[int, int, int] = (255, 255, 255)):
-    font = pygame.font.Font(paths.FONTS.value + font_name, font_size)
-    return font.render(text, True, text_color)
+    return FONT_CACHE.get(font_name, font_size).render(text, True, text_color)
 
 def generate_text_with_height(text: str, height: int, font_name: str, text_color: tuple[int, int, int] = (255, 255, 255)):
-    font_size = 1
-    while True:
-        font = pygame.font.Font(paths.FONTS.value + font_name, font_size)
-        text_surface = font.render(text, True, (255, 255, 255))
-        text_width, text_height = text_surface.get_size()
-
-        if text_height > height:
-            font_size -= 1
-            break
-        font_size += 1
-
-    return font.render(text, True, text_color)
+    """returned surface is shared through TEXT_CACHE, blit it but don't draw onto it"""
+    return TEXT_CACHE.render(text, height, font_name, text_color)
 
 ########################################################### COMPONENTS
 # BASE COMPONENT
 class Sound:
-    def __init__(self, path: str, volume: float = 0.7) -> None:
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-        self.sound = pygame.mixer.Sound(path)
-        self.sound.set_volume(volume)
+    def __init__(self, path: str, volume: float = 0.7, preload: bool = True) -> None:
+        """handle to a clip shared through SOUNDS, volume is applied to the channel it plays on"""
+        self.path   : str   = path
+        self.volume : float = volume
+        self.sound = SOUNDS.load(path) if preload else None
 
     def play(self, repeat=0):
-        self.sound.play(repeat)
+        SOUNDS.play(self.path, self.volume, repeat)
+
+class Music(Sound):
+    def __init__(self, path: str, volume: float = 0.7, loop: bool = True) -> None:
+        """background track streamed from disk through pygame.mixer.music, never decoded whole"""
+        SOUNDS.initialize()
+        super().__init__(path, volume, False)
+        self.loop   : bool  = loop
+        self.paused : bool  = False
+
+    def play(self, repeat=0, fade_ms: int = 0):
+        pygame.mixer.music.load(self.path)
+        pygame.mixer.music.set_volume(self.volume)
+        pygame.mixer.music.play(-1 if self.loop else repeat, fade_ms=fade_ms)
+        self.paused = False
+
+    def stop(self, fade_ms: int = 0):
+        if fade_ms:
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            pygame.mixer.music.stop()
+
+    def set_volume(self, volume: float):
+        self.volume = volume
+        pygame.mixer.music.set_volume(volume)
+
+    def pause(self):
+        if not self.paused:
+            pygame.mixer.music.pause()
+            self.paused = True
+
+    def resume(self):
+        if self.paused:
+            pygame.mixer.music.unpause()
+            self.paused = False
 
 class Component:
-    def __init__(self, tags: list[str], x: float, y: float, center: bool, update_func: callable, hover_func: callable) -> None:
+    # NO __dict__ PER INSTANCE, EVERY SUBCLASS LISTS THE FIELDS IT ADDS
+    __slots__ = ("position_float", "tags", "emit", "surface", "window_size", "position", "center", "update_function", "hover_func", "hover_state_old",
+                 "dt", "initialized", "dirty", "rect_drawn", "static", "visible", "handle", "component_manager_link", "scene_manager_link")
+
+    def __init__(self, tags: tuple[str], x: float, y: float, center: bool, update_func: callable, hover_func: callable) -> None:
         """Base component used to build other components can't be used on its own"""
         self.position_float : list[float]   = [x, y]
-        self.tags           : list[str]     = tags
+        self.tags           : tuple[str]    = tags
         self.emit           : list[Emit]    = []
 
         # EACH COMPONENT HAS TO CREATE ITS OWN SURFACE
         self.surface = None
-        self.window_size    : list[int] = [-1, -1]
+        self.window_size    : tuple[int, int] = (-1, -1)
         self.position       : list[int] = [-1, -1]
 
         self.center = center
@@ -120,21 +158,52 @@ class Component:
         self.dt = 0.0
         self.initialized: bool = False
 
+        # DIRTY RECT RENDERING
+        self.dirty      : bool = True
+        self.rect_drawn : Rect = None
+        # STATIC COMPONENTS ARE BAKED INTO THE SCENE BACKGROUND LAYER
+        self.static     : bool = False
+        # INVISIBLE COMPONENTS ARE LEFT OUT OF DRAWING
+        self.visible    : bool = True
+
+        # INDEX IN ComponentManager.handles, -1 UNTIL ADDED
+        self.handle     : int = -1
+
         # links
         self.component_manager_link = None
         self.scene_manager_link = None
 
+    def mark_dirty(self) -> None:
+        """tells ComponentManager to redraw the area of this component and to re-index its hit box"""
+        self.dirty = True
+        if self.component_manager_link is not None:
+            self.component_manager_link.hit_moved.add(self)
+
+    def send(self, emit: Emit) -> None:
+        """queues emit for the scene, it is handled on the next update of ComponentManager"""
+        self.emit.append(emit)
+        if self.component_manager_link is not None:
+            self.component_manager_link.emit_que[self] = None
+
+    def hit(self, point: tuple[int, int]) -> bool:
+        if self.position[0] + self.surface.width > point[0] > self.position[0]:
+            if self.position[1] + self.surface.height > point[1] > self.position[1]:
+                return True
+        return False
+
     def move_x(self, x: float):
         self.position_float[0] += x
         self.position[0] = int(self.position_float[0] * self.window_size[0])
         if self.center:
             self.position[0] -= self.surface.width // 2
+        self.mark_dirty()
 
     def move_y(self, y: float):
         self.position_float[1] += y
         self.position[1] = int(self.position_float[1] * self.window_size[1])
         if self.center:
             self.position[1] -= self.surface.height // 2
+        self.mark_dirty()
 
     def move(self, x: float, y: float):
         self.move_x(x)
@@ -160,25 +229,26 @@ class Component:
     def draw(self) -> None:
         pass
 
+    def blit(self, surface_target: Surface) -> None:
+        """puts the component on the frame, clipped to the area being redrawn"""
+        surface_target.blit(self.surface, self.position)
+
     def update(self, dt) -> None:
         self.dt = dt
         if self.initialized:
             if self.update_function is not None:
                 self.update_function(self)
 
-            if self.hover_func is not None:
-                # WTF TODO
-                mouse_pos = pygame.mouse.get_pos()
-                hovering = False
-                if self.position[0] + self.surface.width > mouse_pos[0] > self.position[0]:
-                    if self.position[1] + self.surface.height > mouse_pos[1] > self.position[1]:
-                        hovering = True
-                self.hover_func(self, hovering)
+    def hover(self, hovering: bool) -> None:
+        """called by ComponentManager while the mouse is over the component and once when it leaves"""
+        self.hover_func(self, hovering)
 
 # BASIC COMPONENT
 class Solid(Component):
+    __slots__ = ("w", "h", "color")
+
     def __init__(self, x: float, y: float, w: float, h: float, color: tuple[int, int, int, int], center: bool = True, update_func: callable = None, hover_func: callable = None):
-        super().__init__([], x, y, center, update_func, hover_func)
+        super().__init__((), x, y, center, update_func, hover_func)
         self.w = w
         self.h = h
 
@@ -197,31 +267,67 @@ class Solid(Component):
 
     def draw(self) -> None:
         self.surface.fill(self.color)
+        self.mark_dirty()
 
     def change_color(self, new_color: tuple[int, int, int, int]):
         if self.color != new_color:
             self.color = new_color
             self.draw()
 
+class Overlay(Solid):
+    """full color layer blended straight onto the frame with two fills, invisible while fully transparent"""
+    __slots__ = ()
+
+    def initialize(self, window_size: tuple[int, int], component_manager_link: 'ComponentManager') -> None:
+        self.initialize_defaults(window_size, component_manager_link)
+
+        self.window_size = window_size
+        # OPAQUE, ONLY GIVES THE SIZE AND A FALLBACK FOR PLAIN BLITS, ALPHA IS APPLIED IN blit
+        self.surface: Surface = Surface((self.w * window_size[0], self.h * window_size[1]))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+
+        # SET GLOBAL POSITION
+        self.move(0, 0)
+        self.draw()
+
+    def draw(self) -> None:
+        r, g, b, a = self.color
+        self.surface.fill((r, g, b))
+        self.surface.set_alpha(a)
+        self.visible = a > 0
+        self.mark_dirty()
+
+    def blit(self, surface_target: Surface) -> None:
+        # FRAME * (1 - ALPHA) + COLOR * ALPHA, CHEAPER THAN BLITTING AN ALPHA SURFACE OF THE WINDOW SIZE
+        r, g, b, a = self.color
+        rect = Rect(self.position, self.surface.get_size())
+        surface_target.fill((255 - a, 255 - a, 255 - a), rect, special_flags=BLEND_RGB_MULT)
+        surface_target.fill((r * a // 255, g * a // 255, b * a // 255), rect, special_flags=BLEND_RGB_ADD)
+
+    def change_alpha(self, alpha: int) -> None:
+        """fading only changes alpha, nothing is refilled"""
+        r, g, b, a = self.color
+        if a != alpha:
+            self.color = (r, g, b, alpha)
+            self.surface.set_alpha(alpha)
+            self.visible = alpha > 0
+            self.mark_dirty()
+
 class Image(Component):
+    __slots__ = ("image_path", "image", "color", "s", "v_flip", "size")
+
     def __init__(self, x: float, y: float, s: float, path: any, center: bool = True, update_func: callable = None, hover_func: callable = None, v_flip: bool = False, color: tuple[int, int, int, int] = None) -> None:
         """Component used for displaying image"""
-        super().__init__([], x, y, center, update_func, hover_func)
+        super().__init__((), x, y, center, update_func, hover_func)
 
         self.image_path : str       = None
         self.image      : Surface   = None
         if type(path) is str:
             self.image_path: str = path
-            self.image: Surface = image_load(path)
-
-            if self.image_path.split(".")[1] == "png":
-                self.image.convert_alpha()
-            else:
-                self.image.convert()
-
+            self.image: Surface = ASSETS.image(path)
         elif type(path) is Surface:
             self.image = path
-            self.image.convert_alpha()
         else:
             raise AttributeError("Bad Type Input")
 
@@ -229,6 +335,7 @@ class Image(Component):
 
         self.s      : float = s
         self.v_flip : bool = v_flip
+        self.size   : tuple[int, int] = None
 
     def initialize(self, window_size: tuple[int, int], component_manager_link: 'ComponentManager') -> None:
         self.initialize_image(window_size, component_manager_link)
@@ -237,36 +344,37 @@ class Image(Component):
     def initialize_image(self, window_size: tuple[int, int], component_manager_link: 'ComponentManager') -> None:
         self.initialize_defaults(window_size, component_manager_link)
 
+        # PICK UP THE DISPLAY CONVERTED IMAGE
+        if self.image_path is not None:
+            self.image = ASSETS.image(self.image_path)
+
         self.window_size = window_size
         # CREATE SURFACE
         aspect_ratio = self.image.width / self.image.height
-        self.surface: Surface = Surface((self.s*window_size[1]*aspect_ratio, self.s*window_size[1]), SRCALPHA | HWSURFACE | SRCALPHA)
+        self.size: tuple[int, int] = (int(self.s*window_size[1]*aspect_ratio), int(self.s*window_size[1]))
+        self.draw()
 
         # SET GLOBAL POSITION
         self.move(0, 0)
 
     def draw(self) -> None:
-        self.surface.fill((0, 0, 0, 0))
-        temp_image = transform.smoothscale(self.image, (self.surface.width, self.surface.height))
-        if self.v_flip:
-            temp_image = transform.flip(temp_image, False, True)
-        self.surface.blit(temp_image, (0, 0))
-
-        if self.color:
-            self.modulate_color()
+        # VARIANT IS SHARED BY IMAGE_CACHE, DON'T DRAW ONTO IT
+        source = self.image_path if self.image_path is not None else self.image
+        self.surface = IMAGE_CACHE.variant(source, self.image, self.size, self.v_flip, self.color or None)
+        self.mark_dirty()
 
     def modulate_color(self, color: tuple[int, int, int, int] = None):
         if color:
             self.color = color
-        if self.initialized and self.color is not None:
-            temp_color = Surface(self.surface.size, pygame.SRCALPHA)
-            temp_color.fill(self.color)
-            self.surface.blit(temp_color, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        if self.initialized:
+            self.draw()
 
 class Text(Component):
+    __slots__ = ("s", "text_content", "font_name", "color", "text_label", "dbg")
+
     def __init__(self, x: float, y: float, s: float, text: str, color: tuple[int, int, int] = (255, 255, 255), center: bool = True, update_func: callable = None, hover_func: callable = None, dbg: bool = False, font_name: str = TEXT_FONT) -> None:
         """Component used for displaying image"""
-        super().__init__([], x, y, center, update_func, hover_func)
+        super().__init__((), x, y, center, update_func, hover_func)
         self.s              : float = s
         self.text_content   : str   = text
 
@@ -290,23 +398,22 @@ class Text(Component):
 
         # CREATE SURFACE
         self.text_label: Surface = generate_text_with_height(self.text_content, int(self.window_size[1] * self.s), self.font_name, self.color)
-        self.surface: Surface = Surface((self.text_label.width, self.text_label.height), SRCALPHA | HWSURFACE)
+        self.surface: Surface = self.text_label
 
         # SET GLOBAL POSITION
         self.move(0, 0)
 
     def draw(self) -> None:
-        self.surface.fill((0, 0, 0, 0))
-        if self.dbg:
-            self.surface.fill((255, 0, 255, 100))
-
         self.text_label = generate_text_with_height(self.text_content, int(self.window_size[1] * self.s), self.font_name, self.color)
-        self.surface = Surface((self.text_label.width, self.text_label.height), SRCALPHA | HWSURFACE)
-        x = (self.surface.width - self.text_label.width) // 2
-        y = (self.surface.height - self.text_label.height) // 2
-        self.surface.blit(self.text_label, (x, y))
 
-        self.surface.blit(self.surface, (0, 0))
+        # LABEL IS SHARED BY TEXT_CACHE, ONLY DEBUG DRAWING NEEDS ITS OWN SURFACE
+        if self.dbg:
+            self.surface = Surface((self.text_label.width, self.text_label.height), SRCALPHA | HWSURFACE)
+            self.surface.fill((255, 0, 255, 100))
+            self.surface.blit(self.text_label, (0, 0))
+        else:
+            self.surface = self.text_label
+        self.mark_dirty()
 
     def change_text(self, new_text: str):
         if str(new_text) != self.text_content:
@@ -319,47 +426,81 @@ class Text(Component):
             self.color = new_color
             self.draw()
 
+class NumberText(Text):
+    __slots__ = ("glyph_surface",)
+
+    def __init__(self, x: float, y: float, s: float, text: str, color: tuple[int, int, int] = (255, 255, 255), center: bool = True, update_func: callable = None, hover_func: callable = None, dbg: bool = False, font_name: str = TEXT_FONT) -> None:
+        """Text for int_smart_str style counters, composed from GLYPH_ATLAS instead of rendering the whole string"""
+        super().__init__(x, y, s, text, color, center, update_func, hover_func, dbg, font_name)
+        self.glyph_surface: Surface = None
+
+    def initialize_text(self, window_size: tuple[int, int], component_manager_link: 'ComponentManager') -> None:
+        self.initialize_defaults(window_size, component_manager_link)
+
+        self.window_size = window_size
+
+        # CREATE SURFACE
+        self.draw()
+
+        # SET GLOBAL POSITION
+        self.move(0, 0)
+
+    def draw(self) -> None:
+        surface = None
+        if not self.dbg:
+            surface = GLYPH_ATLAS.compose(self.text_content, int(self.window_size[1] * self.s), self.font_name, self.color, self.glyph_surface)
+
+        # NOT A NUMBER -> REGULAR TEXT
+        if surface is None:
+            super().draw()
+        else:
+            self.glyph_surface = surface
+            self.surface = surface
+            self.mark_dirty()
+
 # COMPLEX COMPONENT
 class ButtonText(Text):
+    __slots__ = ("function_click", "switch_scene", "button_noize")
+
     def __init__(self, x: float, y: float, s: float, text: str, click_func: callable = None, color: tuple[int, int, int] = (255, 255, 255), center: bool = True, update_func: callable = None, switch_scene: str = "", hover_func: callable = None, dbg: bool = False, font_name: str = TEXT_FONT):
         super().__init__(x, y, s, text, color, center, update_func, hover_func, dbg, font_name)
-        self.tags = ["button"]
+        self.tags = ("button",)
         self.function_click: callable = click_func
         self.switch_scene: str = switch_scene
         self.button_noize = Sound(mp3_path("button"), 0.1)
 
-    def check_click(self, button) -> None:
-        mouse_pos = pygame.mouse.get_pos()
+    def click(self, button) -> None:
+        """called by ComponentManager when button is pressed over the component"""
         if button == 1:
-            if self.position[0] + self.surface.width > mouse_pos[0] > self.position[0]:
-                if self.position[1] + self.surface.height > mouse_pos[1] > self.position[1]:
-                    self.button_noize.play()
-                    if self.function_click is not None:
-                        self.function_click(self)
-                    if self.switch_scene:
-                        self.scene_manager_link.switch_scene(self.switch_scene)
+            self.button_noize.play()
+            if self.function_click is not None:
+                self.function_click(self)
+            if self.switch_scene:
+                self.scene_manager_link.switch_scene(self.switch_scene)
 
 class ButtonImage(Image):
+    __slots__ = ("function_click", "switch_scene", "button_noize")
+
     def __init__(self, x: float, y: float, s: float, path: any, click_func: callable = None, center: bool = True, update_func: callable = None, switch_scene: str = "", hover_func: callable = None, v_flip: bool = False, color: tuple[int, int, int, int] = None) -> None:
         """Component used for displaying image and also having clickable hit box"""
         super().__init__(x, y, s, path, center, update_func, hover_func, v_flip, color)
-        self.tags = ["button"]
+        self.tags = ("button",)
         self.function_click : callable  = click_func
         self.switch_scene   : str       = switch_scene
         self.button_noize = Sound(mp3_path("button"), 0.1)
 
-    def check_click(self, button) -> None:
-        mouse_pos = pygame.mouse.get_pos()
+    def click(self, button) -> None:
+        """called by ComponentManager when button is pressed over the component"""
         if button == 1:
-            if self.position[0] + self.surface.width > mouse_pos[0] > self.position[0]:
-                if self.position[1] + self.surface.height > mouse_pos[1] > self.position[1]:
-                    self.button_noize.play()
-                    if self.function_click is not None:
-                        self.function_click(self)
-                    if self.switch_scene:
-                        self.scene_manager_link.switch_scene(self.switch_scene)
+            self.button_noize.play()
+            if self.function_click is not None:
+                self.function_click(self)
+            if self.switch_scene:
+                self.scene_manager_link.switch_scene(self.switch_scene)
 
 class ButtonImageText(ButtonImage):
+    __slots__ = ("raw_text", "text", "text_color", "text_scale")
+
     def __init__(self, x: float, y: float, s: float, path: str, text: str,  text_color: tuple[int, int, int], click_func: callable = None, text_scale: float = 1, center: bool = True, update_func: callable = None, switch_scene: str = "", hover_func: callable = None, v_flip: bool = False) -> None:
         super().__init__(x, y, s, path, click_func, center, update_func, switch_scene, hover_func, v_flip)
         self.raw_text: str = text
@@ -379,33 +520,35 @@ class ButtonImageText(ButtonImage):
     def draw(self) -> None:
         super().draw()
 
+        # IMAGE VARIANT IS SHARED, TEXT GOES ONTO A COPY
+        self.surface = self.surface.copy()
         self.surface.blit(self.text, ((self.surface.width - self.text.width) // 2, (self.surface.height - self.text.height * 0.70) // 2))
 
 # GAME SPECIFIC COMPONENTS
 class ShopButton(Component):
-    def __init__(self, x: float, y: float, s: float, img_bg: Surface, img_ico: str, cost: list[str, int], hover_text: str, emit: str, global_offset: tuple[int, int]=(0, 0)):
+    __slots__ = ("click_emit", "img_bg_path", "hover_text", "global_offset", "img_ico_path", "init_cost0", "init_cost1", "cost",
+                 "cost_img0_path", "cost_img1_path", "s", "game_data", "button_noize")
+
+    def __init__(self, x: float, y: float, s: float, img_bg: str, img_ico: str, cost: list[str, int], hover_text: str, emit: str, global_offset: tuple[int, int]=(0, 0)):
         def hover(self, state):
             if state:
-                self.emit.append(Emit("HoverWindow", [self.hover_text]))
-        super().__init__(["button"], x, y, False, None, hover)
+                self.send(Emit("HoverWindow", [self.hover_text]))
+        super().__init__(("button",), x, y, False, None, hover)
         self.click_emit: str = emit
 
-        self.img_bg : Surface = img_bg
+        self.img_bg_path: str = img_bg
         self.hover_text: str = hover_text
 
         self.global_offset: tuple[int, int] = global_offset
 
-        self.img_ico: Surface = image_load(img_ico)
-        self.img_ico.convert_alpha()
+        self.img_ico_path: str = img_ico
 
         self.init_cost0 = cost[2]
         self.init_cost1 = cost[5]
 
         self.cost: list[str, int] = cost
-        self.cost_img0: Surface = image_load(img_path("Icons\\ico_" + cost[0] + ".png"))
-        self.cost_img0.convert_alpha()
-        self.cost_img1: Surface = image_load(img_path("Icons\\ico_" + cost[3] + ".png"))
-        self.cost_img1.convert_alpha()
+        self.cost_img0_path: str = img_path("Icons/ico_" + cost[0] + ".png")
+        self.cost_img1_path: str = img_path("Icons/ico_" + cost[3] + ".png")
 
         self.s: float = s
         self.game_data: GameData = None
@@ -425,17 +568,15 @@ class ShopButton(Component):
         self.move(0, 0)
         self.draw()
 
-    def check_click(self, button) -> None:
-        mouse_pos = pygame.mouse.get_pos()
+    def click(self, button) -> None:
+        """called by ComponentManager when button is pressed over the component"""
         if button == 1:
-            if self.position[0] + self.surface.width > mouse_pos[0] > self.position[0]:
-                if self.position[1] + self.surface.height > mouse_pos[1] > self.position[1]:
-                    if self.game_data.resource_get(self.cost[1]) >= self.cost[2]:
-                        if self.game_data.resource_get(self.cost[4]) >= self.cost[5]:
-                            self.button_noize.play()
-                            self.emit.append(Emit(self.click_emit, []))
-                            self.game_data.resource_take(self.cost[1], self.cost[2])
-                            self.game_data.resource_take(self.cost[4], self.cost[5])
+            if self.game_data.resource_get(self.cost[1]) >= self.cost[2]:
+                if self.game_data.resource_get(self.cost[4]) >= self.cost[5]:
+                    self.button_noize.play()
+                    self.send(Emit(self.click_emit, []))
+                    self.game_data.resource_take(self.cost[1], self.cost[2])
+                    self.game_data.resource_take(self.cost[4], self.cost[5])
 
     def reset(self):
         a, b, c, d, e, f = self.cost
@@ -443,17 +584,18 @@ class ShopButton(Component):
         self.draw()
 
     def draw(self) -> None:
+        self.mark_dirty()
         self.surface.fill((0, 0, 0, 0))
 
-        temp_bg = pygame.transform.smoothscale(self.img_bg, self.surface.size)
+        temp_bg = IMAGE_CACHE.variant(self.img_bg_path, ASSETS.image(self.img_bg_path), self.surface.size)
         self.surface.blit(temp_bg, (0, 0))
 
-        temp_icon = pygame.transform.smoothscale(self.img_ico, (self.surface.height, self.surface.height))
+        temp_icon = IMAGE_CACHE.variant(self.img_ico_path, ASSETS.image(self.img_ico_path), (self.surface.height, self.surface.height))
         self.surface.blit(temp_icon, (0, 0))
 
-        size = self.surface.height // 1.5
-        temp_cost_0 = pygame.transform.smoothscale(self.cost_img0, (size, size))
-        temp_cost_1 = pygame.transform.smoothscale(self.cost_img1, (size, size))
+        size = int(self.surface.height // 1.5)
+        temp_cost_0 = IMAGE_CACHE.variant(self.cost_img0_path, ASSETS.image(self.cost_img0_path), (size, size))
+        temp_cost_1 = IMAGE_CACHE.variant(self.cost_img1_path, ASSETS.image(self.cost_img1_path), (size, size))
         self.surface.blit(temp_cost_0, (temp_icon.width+self.surface.width*0.1, 0))
         self.surface.blit(temp_cost_1, (temp_icon.width+(self.surface.width * 0.5), 0))
 
@@ -473,10 +615,12 @@ class ShopButton(Component):
     def move_x(self, x: float):
         self.position_float[0] += x
         self.position[0] = int(self.position_float[0] * self.window_size[0]) + self.global_offset[0]
+        self.mark_dirty()
 
     def move_y(self, y: float):
         self.position_float[1] += y
         self.position[1] = int(self.position_float[1] * self.window_size[1]) + self.global_offset[1]
+        self.mark_dirty()
 
 
 ########################################################### SCENES
@@ -485,29 +629,59 @@ class SceneBase:
     def __init__(self, name: str) -> None:
         self.name               : str              = name
         self.component_manager  : ComponentManager = ComponentManager()
+        self.events             : EventBus         = EventBus()
+        self.tweens             : TweenManager     = TweenManager()
 
         self.scene_manager_link = None
+        self.game_data          : GameData         = None
+
+        # BINDING ACTIONS WHOSE FIELDS CHANGED SINCE THE LAST UPDATE, DICT KEEPS ORDER AND RUNS EACH ONCE
+        self.bindings_pending: dict[callable:None] = {}
 
         self.create()
+        self.create_events()
 
     def initialize(self, screen_size: tuple[int, int], scene_manager_link: 'SceneManager', game_data: GameData = None) -> None:
         self.scene_manager_link: SceneManager = scene_manager_link
         self.component_manager.initialize(screen_size, self, game_data)
+        self.game_data = game_data
+        if game_data is not None:
+            self.create_bindings()
 
-    def new_comp(self, component: Component, comp_id: str = ""):
+    def new_comp(self, component: Component, comp_id: str = "", static: bool = False):
+        """static components are drawn below all the others, only flag ones no dynamic component lies under"""
+        component.static = static
         self.component_manager.new_component(component, comp_id)
 
     def get_comp(self, comp_id: str):
         return self.component_manager.get_component(comp_id)
 
     def get_last_comp(self) -> Component:
-        return list(self.component_manager.components.values())[-1]
+        return self.component_manager.draw_list[-1]
 
-    def draw(self, surface_target: Surface) -> None:
-        self.component_manager.draw(surface_target)
+    def draw(self, surface_target: Surface) -> list[Rect]:
+        return self.component_manager.draw(surface_target)
 
     def update(self, dt: float) -> None:
+        self.tweens.update(dt)
         self.component_manager.update(dt)
+        self.bindings_action()
+
+    def slide(self, comp_id: str, start: tuple[float, float], end: tuple[float, float], duration: float, ease: callable = ease_out, on_done: callable = None) -> None:
+        """moves comp_id from start to end in duration seconds"""
+        component = self.get_comp(comp_id)
+        self.tweens.add((comp_id, "position"), Tween(start, end, duration, lambda position: component.move_to(*position), ease, on_done))
+
+    def fade(self, comp_id: str, start: tuple, end: tuple, duration: float, ease: callable = ease_out, on_done: callable = None) -> None:
+        """changes the color of comp_id from start to end in duration seconds"""
+        component = self.get_comp(comp_id)
+        self.tweens.add((comp_id, "color"), Tween(start, end, duration, lambda color: component.change_color(tuple(round(c) for c in color)), ease, on_done))
+
+    def flash(self, color: tuple[int, int, int, int]) -> None:
+        """shows the FlashBang overlay in color and fades it out, 300 alpha per second"""
+        overlay = self.get_comp("FlashBang")
+        overlay.change_color(tuple(color))
+        self.tweens.add(("FlashBang", "alpha"), Tween(color[3], 0, color[3] / 300, lambda alpha: overlay.change_alpha(round(alpha))))
 
     def handle_key(self, key: str) -> None:
         pass
@@ -516,6 +690,32 @@ class SceneBase:
         self.component_manager.handle_mouse(button)
 
     def handel_emit(self, emit: Emit):
+        self.events.dispatch(emit)
+
+    def bind(self, fields: list[str], action: callable) -> None:
+        """action() runs on the next update after any of fields changes on game_data, see GameData.watch"""
+        def changed():
+            self.bindings_pending[action] = None
+        for field in fields:
+            self.game_data.watch(field, changed)
+        changed()
+
+    def bind_text(self, comp_id: str, fields: list[str], text_func: callable) -> None:
+        """component comp_id shows text_func() and is only redrawn when fields change"""
+        component = self.get_comp(comp_id)
+        self.bind(fields, lambda: component.change_text(text_func()))
+
+    def bindings_action(self) -> None:
+        pending, self.bindings_pending = self.bindings_pending, {}
+        for action in pending:
+            action()
+
+    def create_bindings(self) -> None:
+        """binds labels to game_data fields, runs after initialize when there is game_data"""
+        pass
+
+    def create_events(self) -> None:
+        """registers handlers on self.events, runs after create"""
         pass
 
     def on_scene_switch(self):
@@ -530,6 +730,10 @@ class SceneMainMenu(SceneBase):
         super().__init__("main_menu")
         self.initialized = False
 
+        # BUTTONS ONLY WORK ONCE THEY SLID IN, START ONLY ONCE PER VISIT
+        self.buttons_ready  : bool = False
+        self.start_clickable: bool = True
+
     def create(self) -> None:
 
 
@@ -551,134 +755,76 @@ class SceneMainMenu(SceneBase):
                 self.hover_state_old = state
 
         # BG
-        self.new_comp(Image(0, 0, 1, img_path("Bg\\menu.png"), False))
+        self.new_comp(Image(0, 0, 1, img_path("Bg/menu.png"), False), static=True)
 
         # BUTTONS
-        def anim_slide_in_buttons(self):
-            try:
-                self.anim
-            except AttributeError:
-                self.anim = False
-                self.anim_done = False
-
-            if self.anim:
-                target = 0.5
-                if self.position_float[0] >= target:
-                    self.position_float[0] = target
-                    self.move_x(0)
-                    self.update_function = None
-                self.move_x((target - self.position_float[0] + 0.003) / 10)
+        menu = self
         def on_click_start(self):
-            try:
-                self.clickable
-            except AttributeError:
-                self.clickable = True
-
-            if self.anim_done and self.clickable:
-                self.clickable = False
+            if menu.buttons_ready and menu.start_clickable:
+                menu.start_clickable = False
                 self.scene_manager_link.history_add_self()
-                self.emit.append(Emit("start_game", []))
+                self.send(Emit("start_game", []))
         def on_click_settings(self):
-            if self.anim_done:
+            if menu.buttons_ready:
                 self.scene_manager_link.switch_scene("settings")
         def on_click_quit(self):
             pygame.event.post(pygame.event.Event(pygame.QUIT))
 
 
-        self.new_comp(ButtonText(-1-0.15, 0.55, 0.2, "START", color=(68, 53, 52), font_name=BUTTON_FONT, click_func=on_click_start, update_func=anim_slide_in_buttons, hover_func=anim_hover_change_color), "button_start")
-        self.new_comp(ButtonText(-1-0.15, 0.75, 0.16, "SETTINGS", color=(68, 53, 52), font_name=BUTTON_FONT, click_func=on_click_settings, update_func=anim_slide_in_buttons, hover_func=anim_hover_change_color), "button_settings")
-        self.new_comp(ButtonText(-1-0.15, 0.92, 0.14, "QUIT", color=(68, 53, 52), font_name=BUTTON_FONT, click_func=on_click_quit, update_func=anim_slide_in_buttons, hover_func=anim_hover_change_color), "button_quit")
+        self.new_comp(ButtonText(-1-0.15, 0.55, 0.2, "START", color=(68, 53, 52), font_name=BUTTON_FONT, click_func=on_click_start, hover_func=anim_hover_change_color), "button_start")
+        self.new_comp(ButtonText(-1-0.15, 0.75, 0.16, "SETTINGS", color=(68, 53, 52), font_name=BUTTON_FONT, click_func=on_click_settings, hover_func=anim_hover_change_color), "button_settings")
+        self.new_comp(ButtonText(-1-0.15, 0.92, 0.14, "QUIT", color=(68, 53, 52), font_name=BUTTON_FONT, click_func=on_click_quit, hover_func=anim_hover_change_color), "button_quit")
 
         # LOGO
-        def anim_slide_in_logo(self):
-            try:
-                self.anim
-            except AttributeError:
-                self.anim = False
-
-            if self.anim:
-                target = 0.5
-                if self.position_float[0] <= target:
-                    self.position_float[0] = target
-                    self.update_function = None
-                    self.move_x(0)
-                    self.emit.append(Emit("anim_done", []))
-                self.move_x(-(self.position_float[0] + 0.003 - target) / 10)
-
         #self.new_comp(Solid(0.5, 0.125, 1, 0.23, (0, 0, 0, 100)))
-        self.new_comp(Text(1+0.7, 0.195, 0.2813, "<ELEMENTAL>   <VILLAGE>", (102, 79, 78), update_func=anim_slide_in_logo, font_name=LOGO_FONT), "logo_b")
-        self.new_comp(Text(1+0.7, 0.19, 0.28, "<ELEMENTAL>   <VILLAGE>", (68, 53, 52), update_func=anim_slide_in_logo, font_name=LOGO_FONT), "logo")
+        self.new_comp(Text(1+0.7, 0.195, 0.2813, "<ELEMENTAL>   <VILLAGE>", (102, 79, 78), font_name=LOGO_FONT), "logo_b")
+        self.new_comp(Text(1+0.7, 0.19, 0.28, "<ELEMENTAL>   <VILLAGE>", (68, 53, 52), font_name=LOGO_FONT), "logo")
 
         # FLASH EFFECT
-        def anim_flashbang_fadeout(self):
-            if self.color != [255, 255, 255, 0]:
-                r, g, b, a = self.color
-                self.change_color([r, g, b, max(a-5, 0)])
-
-        self.new_comp(Solid(0, 0, 1, 1, (255, 255, 255, 0), False, anim_flashbang_fadeout), "FlashBang")
+        self.new_comp(Overlay(0, 0, 1, 1, (255, 255, 255, 0), False), "FlashBang")
 
         # Start Transition
-        def anim_start_transition(self):
-            try:
-                self.anim_speed
-            except AttributeError:
-                self.anim_speed = 0
-
-            if self.anim_speed != 0:
-                if self.position_float[1] < -0.5:
-                    self.move_y(0.001 * self.anim_speed)
-                    self.anim_speed *= 1.1
-                elif self.anim_speed != 0:
-                    self.anim_speed = 0
-                    self.emit.append(Emit("SwitchToGame", []))
-
-        self.new_comp(Solid(0, 1.1, 1, 2, (34, 34, 34, 255), False, anim_start_transition), "StartAnim")
+        self.new_comp(Solid(0, 1.1, 1, 2, (34, 34, 34, 255), False), "StartAnim")
 
         # Init Transition
-        def anim_init_transition(self):
-            try:
-                self.anim_speed
-            except AttributeError:
-                self.anim_speed = 1
+        self.new_comp(Solid(0, 0, 1, 1, (0, 0, 0, 255), False), "InitAnim")
 
-            if self.position_float[1] < 1.1:
-                self.move_y(0.001 * self.anim_speed)
-                self.anim_speed *= 1.1
-                r, g, b, a = self.color
-                if r != 34:
-                    self.change_color((r+0.5, g+0.5, b+0.5, a))
-            elif self.anim_speed != 0:
-                self.anim_speed = 0
-                self.emit.append(Emit("ButtonSlide", []))
-
-        self.new_comp(Solid(0, 0, 1, 1, (0, 0, 0, 255), False, anim_init_transition))
+    def initialize(self, screen_size: tuple[int, int], scene_manager_link: 'SceneManager', game_data: GameData = None) -> None:
+        super().initialize(screen_size, scene_manager_link, game_data)
 
+        # INIT TRANSITION, FADES IN FROM BLACK WHILE FALLING OUT OF THE WINDOW
+        button_slide = lambda: self.handel_emit(Emit("ButtonSlide", []))
+        self.slide("InitAnim", (0, 0), (0, 1.1), 0.8, ease_in, button_slide)
+        self.fade("InitAnim", (0, 0, 0, 255), (25, 25, 25, 255), 0.8, ease_linear)
 
     def on_scene_switch(self):
         if self.initialized:
-            self.get_comp("FlashBang").change_color((255, 255, 255, 100))
+            self.flash((255, 255, 255, 100))
+            self.tweens.cancel(("StartAnim", "position"))
             self.get_comp("StartAnim").move_to(0, 1.1)
-            self.get_comp("StartAnim").anim_speed = 0
-            self.get_comp("button_start").clickable = True
+            self.start_clickable = True
         self.initialized = True
 
-    def handel_emit(self, emit: Emit):
-        if emit.name == "anim_done":
-            self.get_comp("FlashBang").change_color((255, 255, 255, 255))
-            self.get_comp("button_settings").anim_done = True
-            self.get_comp("button_quit").anim_done = True
-            self.get_comp("button_start").anim_done = True
-        elif emit.name == "start_game":
-            self.get_comp("StartAnim").anim_speed = 1
-            self.get_comp("StartAnim").move_y(-3.1)
-        elif emit.name == "SwitchToGame":
+    def create_events(self) -> None:
+        def anim_done(emit: Emit):
+            self.flash((255, 255, 255, 255))
+            self.buttons_ready = True
+        def start_game(emit: Emit):
+            switch_to_game = lambda: self.handel_emit(Emit("SwitchToGame", []))
+            self.slide("StartAnim", (0, -2), (0, -0.5), 0.9, ease_in, switch_to_game)
+        def switch_to_game(emit: Emit):
             self.scene_manager_link.switch_scene("game_build", False)
-        elif emit.name == "ButtonSlide":
-            self.get_comp("logo_b").anim = True
-            self.get_comp("logo").anim = True
-            self.get_comp("button_start").anim = True
-            self.get_comp("button_settings").anim = True
-            self.get_comp("button_quit").anim = True
+        def button_slide(emit: Emit):
+            for comp_id in ["logo_b", "button_start", "button_settings", "button_quit"]:
+                component = self.get_comp(comp_id)
+                self.slide(comp_id, tuple(component.position_float), (0.5, component.position_float[1]), 1)
+            anim_done = lambda: self.handel_emit(Emit("anim_done", []))
+            self.slide("logo", tuple(self.get_comp("logo").position_float), (0.5, self.get_comp("logo").position_float[1]), 1, on_done=anim_done)
+
+        self.events.register("anim_done", anim_done)
+        self.events.register("start_game", start_game)
+        self.events.register("SwitchToGame", switch_to_game)
+        self.events.register("ButtonSlide", button_slide)
 
 class SceneSettings(SceneBase):
     def __init__(self) -> None:
@@ -707,11 +853,11 @@ class SceneSettings(SceneBase):
                 self.hover_state_old = state
 
         # BG
-        self.new_comp(Image(-0.2, 0, 1, img_path("Bg\\menu.png"), False))
+        self.new_comp(Image(-0.2, 0, 1, img_path("Bg/menu.png"), False), static=True)
 
         # APPLY / BACK
         def apply_settings(self):
-            self.emit.append(Emit("change_settings", [float(self.component_manager_link.get_component("win_offset").text_content)]))
+            self.send(Emit("change_settings", [float(self.component_manager_link.get_component("win_offset").text_content)]))
 
         self.new_comp(ButtonText(0.9, 0.8, 0.2, "APPLY", click_func=apply_settings, color=(68, 53, 52), font_name=BUTTON_FONT, hover_func=anim_hover_change_color))
         self.new_comp(ButtonText(0.1, 0.8, 0.2, "BACK", switch_scene="main_menu", color=(68, 53, 52), font_name=BUTTON_FONT, hover_func=anim_hover_change_color))
@@ -728,82 +874,79 @@ class SceneSettings(SceneBase):
             set_win_off.value = value
             return set_win_off
 
-        self.new_comp(Solid(x, 0.5, 0.2, 0.9, (0, 0, 0, 50), True))
-        self.new_comp(Text(x, y, 0.08, "Window Offset", color=(68, 53, 52)))
-        self.new_comp(ButtonImage(x-0.015, y+0.2, 0.2, img_path("Buttons\\up_arrow.png"), click_func=create_set_win_off(0.001), color=(68, 53, 52, 255), hover_func=anim_hover_change_color))
-        self.new_comp(ButtonImage(x+0.015, y+0.2, 0.2, img_path("Buttons\\up_arrow.png"), click_func=create_set_win_off(0.01), color=(68, 53, 52, 255), hover_func=anim_hover_change_color))
+        self.new_comp(Solid(x, 0.5, 0.2, 0.9, (0, 0, 0, 50), True), static=True)
+        self.new_comp(Text(x, y, 0.08, "Window Offset", color=(68, 53, 52)), static=True)
+        self.new_comp(ButtonImage(x-0.015, y+0.2, 0.2, img_path("Buttons/up_arrow.png"), click_func=create_set_win_off(0.001), color=(68, 53, 52, 255), hover_func=anim_hover_change_color))
+        self.new_comp(ButtonImage(x+0.015, y+0.2, 0.2, img_path("Buttons/up_arrow.png"), click_func=create_set_win_off(0.01), color=(68, 53, 52, 255), hover_func=anim_hover_change_color))
         self.new_comp(Text(x, y+0.4, 0.1, "0", color=(68, 53, 52)), "win_offset")
-        self.new_comp(ButtonImage(x - 0.015, y+0.6, 0.2, img_path("Buttons\\up_arrow.png"), v_flip=True, click_func=create_set_win_off(-0.001), color=(68, 53, 52, 255), hover_func=anim_hover_change_color))
-        self.new_comp(ButtonImage(x + 0.015, y+0.6, 0.2, img_path("Buttons\\up_arrow.png"), v_flip=True, click_func=create_set_win_off(-0.01), color=(68, 53, 52, 255), hover_func=anim_hover_change_color))
+        self.new_comp(ButtonImage(x - 0.015, y+0.6, 0.2, img_path("Buttons/up_arrow.png"), v_flip=True, click_func=create_set_win_off(-0.001), color=(68, 53, 52, 255), hover_func=anim_hover_change_color))
+        self.new_comp(ButtonImage(x + 0.015, y+0.6, 0.2, img_path("Buttons/up_arrow.png"), v_flip=True, click_func=create_set_win_off(-0.01), color=(68, 53, 52, 255), hover_func=anim_hover_change_color))
 
         # FLASH EFFECT
-        def anim_flashbang_fadeout(self):
-            if self.color != [255, 255, 255, 0]:
-                r, g, b, a = self.color
-                self.change_color([r, g, b, max(a-5, 0)])
-
-        self.new_comp(Solid(0, 0, 1, 1, (255, 255, 255, 0), False, anim_flashbang_fadeout), "FlashBang")
+        self.new_comp(Overlay(0, 0, 1, 1, (255, 255, 255, 0), False), "FlashBang")
 
     def on_scene_switch(self):
         self.component_manager.get_component("win_offset").change_text(str(self.settings_link.win_bottom_offset))
-        self.get_comp("FlashBang").change_color((255, 255, 255, 100))
+        self.flash((255, 255, 255, 100))
 
-    def handel_emit(self, emit: Emit):
-        if emit.name == "change_settings":
+    def create_events(self) -> None:
+        def change_settings(emit: Emit):
             self.settings_link.win_bottom_offset = emit.data[0]
             self.redraw_window(0, self.screen_size[1]-self.window_size[1]-(self.screen_size[1]*self.settings_link.win_bottom_offset))
-            self.get_comp("FlashBang").change_color((0, 0, 0, 100))
+            self.flash((0, 0, 0, 100))
 
             file_settings_save(self.settings_link)
 
+        self.events.register("change_settings", change_settings)
+
 # GAME SCENES
-IMAGE_VERT_NAV_BUTTON = image_load(img_path("Ui\\button.png"))
-IMAGE_VERT_NAV_BUILD = image_load(img_path("Buttons//btn_build.png"))
-IMAGE_VERT_NAV_WORK = image_load(img_path("Buttons//btn_work.png"))
-IMAGE_VERT_NAV_BATTLE = image_load(img_path("Buttons//btn_battle.png"))
-IMAGE_VERT_NAV_ASCEND = image_load(img_path("Buttons//btn_ascend.png"))
-IMAGE_VERT_NAV_STATS = image_load(img_path("Buttons//btn_stats.png"))
-IMAGE_VERT_NAV_BACK = image_load(img_path("Buttons//btn_back.png"))
-IMAGE_VERT_NAV_MENU = image_load(img_path("Buttons//btn_menu.png"))
-
-IMAGE_TOP_BAR_BAR = image_load(img_path("Ui\\info_bar.png"))
-IMAGE_TOP_BAR_BREAK = image_load(img_path("Ui\\info_bar_break.png"))
-IMAGE_TOP_BAR_HOUSING = image_load(img_path("Icons\\ico_house.png"))
-IMAGE_TOP_BAR_POPULATION = image_load(img_path("Icons\\ico_person.png"))
-IMAGE_TOP_BAR_FOOD = image_load(img_path("Icons\\ico_food.png"))
-IMAGE_TOP_BAR_FREE_POPULATION = image_load(img_path("Icons\\ico_shrug.png"))
-IMAGE_TOP_BAR_ASCENTION = image_load(img_path("Icons\\ico_star.png"))
-IMAGE_TOP_BAR_BATTLE_POWER = image_load(img_path("Icons\\ico_sword.png"))
-
-IMAGE_EXTRA_PANEL = image_load(img_path("Ui\\panel.png"))
-IMAGE_SHOP_BUTTON = image_load(img_path("Ui\\shop.png"))
-
-IMAGE_ICON_WOOD = image_load(img_path("Icons\\ico_wood.png"))
-IMAGE_ICON_STONE = image_load(img_path("Icons\\ico_stone.png"))
-IMAGE_ICON_FIBER = image_load(img_path("Icons\\ico_fiber.png"))
-IMAGE_ICON_IRON = image_load(img_path("Icons\\ico_iron.png"))
-IMAGE_ICON_KILLS =image_load(img_path("Icons\\ico_skull.png"))
-IMAGE_ICON_ELEMENTS = image_load(img_path("Icons\\ico_elements.png"))
-IMAGE_ICON_STEEL = image_load(img_path("Icons\\ico_steel.png"))
+IMAGE_VERT_NAV_BUTTON = img_path("Ui/button.png")
+IMAGE_VERT_NAV_BUILD = img_path("Buttons//btn_build.png")
+IMAGE_VERT_NAV_WORK = img_path("Buttons//btn_work.png")
+IMAGE_VERT_NAV_BATTLE = img_path("Buttons//btn_battle.png")
+IMAGE_VERT_NAV_ASCEND = img_path("Buttons//btn_ascend.png")
+IMAGE_VERT_NAV_STATS = img_path("Buttons//btn_stats.png")
+IMAGE_VERT_NAV_BACK = img_path("Buttons//btn_back.png")
+IMAGE_VERT_NAV_MENU = img_path("Buttons//btn_menu.png")
+
+IMAGE_TOP_BAR_BAR = img_path("Ui/info_bar.png")
+IMAGE_TOP_BAR_BREAK = img_path("Ui/info_bar_break.png")
+IMAGE_TOP_BAR_HOUSING = img_path("Icons/ico_house.png")
+IMAGE_TOP_BAR_POPULATION = img_path("Icons/ico_person.png")
+IMAGE_TOP_BAR_FOOD = img_path("Icons/ico_food.png")
+IMAGE_TOP_BAR_FREE_POPULATION = img_path("Icons/ico_shrug.png")
+IMAGE_TOP_BAR_ASCENTION = img_path("Icons/ico_star.png")
+IMAGE_TOP_BAR_BATTLE_POWER = img_path("Icons/ico_sword.png")
+
+IMAGE_EXTRA_PANEL = img_path("Ui/panel.png")
+IMAGE_SHOP_BUTTON = img_path("Ui/shop.png")
+
+IMAGE_ICON_WOOD = img_path("Icons/ico_wood.png")
+IMAGE_ICON_STONE = img_path("Icons/ico_stone.png")
+IMAGE_ICON_FIBER = img_path("Icons/ico_fiber.png")
+IMAGE_ICON_IRON = img_path("Icons/ico_iron.png")
+IMAGE_ICON_KILLS = img_path("Icons/ico_skull.png")
+IMAGE_ICON_ELEMENTS = img_path("Icons/ico_elements.png")
+IMAGE_ICON_STEEL = img_path("Icons/ico_steel.png")
 class SceneGameBase(SceneBase):
     def __init__(self, name: str):
         super().__init__(name)
 
-        self.game_data = None
-
         self.scene_transition: str = None
         self.scene_transition_n_skip: bool = None
 
     def initialize(self, screen_size: tuple[int, int], scene_manager_link: 'SceneManager', game_data: GameData = None) -> None:
         super().initialize(screen_size, scene_manager_link, game_data)
-        self.game_data : GameData = game_data
+        # THE SHARED TOP BAR IS DRAWN OVER THIS SCENE BUT UNDER ITS TRANSITION CURTAINS
+        self.component_manager.overlay = scene_manager_link.hud.component_manager
+        self.component_manager.overlay_below = self.get_comp("AnimTransition")
 
     def custom_switch_scene(self, scene_name: str):
         if self.scene_transition is None and scene_name != self.scene_manager_link.scene_current.name:
             self.scene_transition = scene_name
             self.scene_transition_n_skip = True
-            self.get_comp("AnimTransition").move_to(0, -1.6)
-            self.get_comp("AnimTransition").anim_speed = 1
+            transition = lambda: self.handel_emit(Emit("Transition", []))
+            self.slide("AnimTransition", (0, -1.6), (0, 0), 0.85, ease_in, transition)
 
     def create(self) -> None:
         # VERTICAL SCENE MENU
@@ -823,133 +966,124 @@ class SceneGameBase(SceneBase):
                     self.draw()
                 self.hover_state_old = state
         def click(self):
-            self.emit.append(Emit("BeginTransition", ["game_build", True]))
+            self.send(Emit("BeginTransition", ["game_build", True]))
         size = 0.15
-        self.new_comp(ButtonImage(0, 0, size, IMAGE_VERT_NAV_BUTTON, click, False))
+        self.new_comp(ButtonImage(0, 0, size, IMAGE_VERT_NAV_BUTTON, click, False), static=True)
         self.new_comp(Image(0, 0, size, IMAGE_VERT_NAV_BUILD, False, color=(64, 41, 40, 255), hover_func=anim_hover_vertical_menu))
         def click(self):
-            self.emit.append(Emit("BeginTransition", ["game_work", True]))
-        self.new_comp(ButtonImage(0, 0.15, size, IMAGE_VERT_NAV_BUTTON, click, False))
+            self.send(Emit("BeginTransition", ["game_work", True]))
+        self.new_comp(ButtonImage(0, 0.15, size, IMAGE_VERT_NAV_BUTTON, click, False), static=True)
         self.new_comp(Image(0, 0.15, size, IMAGE_VERT_NAV_WORK, False, color=(64, 41, 40, 255), hover_func=anim_hover_vertical_menu))
         def click(self):
-            self.emit.append(Emit("BeginTransition", ["game_battle", True]))
-        self.new_comp(ButtonImage(0, 0.3, size, IMAGE_VERT_NAV_BUTTON, click, False))
+            self.send(Emit("BeginTransition", ["game_battle", True]))
+        self.new_comp(ButtonImage(0, 0.3, size, IMAGE_VERT_NAV_BUTTON, click, False), static=True)
         self.new_comp(Image(0, 0.3, size, IMAGE_VERT_NAV_BATTLE, False, color=(64, 41, 40, 255), hover_func=anim_hover_vertical_menu))
         def click(self):
-            self.emit.append(Emit("BeginTransition", ["game_ascend", True]))
-        self.new_comp(ButtonImage(0, 0.45, size, IMAGE_VERT_NAV_BUTTON, click, False))
+            self.send(Emit("BeginTransition", ["game_ascend", True]))
+        self.new_comp(ButtonImage(0, 0.45, size, IMAGE_VERT_NAV_BUTTON, click, False), static=True)
         self.new_comp(Image(0, 0.45, size, IMAGE_VERT_NAV_ASCEND, False, color=(64, 41, 40, 255), hover_func=anim_hover_vertical_menu))
         def click(self):
-            self.emit.append(Emit("BeginTransition", ["game_stats", True]))
-        self.new_comp(ButtonImage(0, 0.6, size, IMAGE_VERT_NAV_BUTTON, click, False))
+            self.send(Emit("BeginTransition", ["game_stats", True]))
+        self.new_comp(ButtonImage(0, 0.6, size, IMAGE_VERT_NAV_BUTTON, click, False), static=True)
         self.new_comp(Image(0, 0.6, size, IMAGE_VERT_NAV_STATS, False, color=(64, 41, 40, 255), hover_func=anim_hover_vertical_menu))
         def click(self):
             self.scene_manager_link.back_track()
-        self.new_comp(ButtonImage(0, 0.8, size-0.05, IMAGE_VERT_NAV_BUTTON, click, False))
+        self.new_comp(ButtonImage(0, 0.8, size-0.05, IMAGE_VERT_NAV_BUTTON, click, False), static=True)
         self.new_comp(Image(0, 0.8, size-0.05, IMAGE_VERT_NAV_BACK, False, color=(64, 41, 40, 255), hover_func=anim_hover_vertical_menu))
         def click(self):
             self.scene_manager_link.switch_scene("main_menu")
-        self.new_comp(ButtonImage(0, 0.9, size-0.05, IMAGE_VERT_NAV_BUTTON, click, False))
+        self.new_comp(ButtonImage(0, 0.9, size-0.05, IMAGE_VERT_NAV_BUTTON, click, False), static=True)
         self.new_comp(Image(0, 0.9, size-0.05, IMAGE_VERT_NAV_MENU, False, color=(64, 41, 40, 255), hover_func=anim_hover_vertical_menu))
 
-        # TOP INFO BAR
-        x, spacing = 0.58, 0.032
-        self.new_comp(Image(x, 0, 0.1, IMAGE_TOP_BAR_BAR, False))
-        x += +0.01
-        self.new_comp(Image(x, 0.045, 0.07, IMAGE_TOP_BAR_HOUSING, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x+spacing, 0.045, 0.07, "1 000 000", (64, 41, 40)), "top_bar_housing")
-        self.new_comp(Image(x+spacing*2, 0.045, 0.07, IMAGE_TOP_BAR_POPULATION, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x+spacing*3, 0.045, 0.07, "1 000 000", (64, 41, 40)), "top_bar_population")
-        self.new_comp(Image(x+spacing*4, 0.045, 0.07, IMAGE_TOP_BAR_FOOD, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x+spacing*5, 0.045, 0.07, "1 000 000", (64, 41, 40)), "top_bar_food")
-        self.new_comp(Image(x+spacing*6, 0.045, 0.07, IMAGE_TOP_BAR_FREE_POPULATION, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x+spacing*7, 0.045, 0.07, "1 000 000", (64, 41, 40)), "top_bar_free_population")
-        self.new_comp(Image(x+spacing*8, 0.045, 0.07, IMAGE_TOP_BAR_ASCENTION, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x+spacing*9, 0.045, 0.07, "1 000 000", (64, 41, 40)), "top_bar_ascention")
-        self.new_comp(Image(x+spacing*10, 0.045, 0.1, IMAGE_TOP_BAR_BREAK))
-        x += 0.01
-        self.new_comp(Image(x+spacing*10, 0.045, 0.07, IMAGE_TOP_BAR_BATTLE_POWER, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x+spacing*11, 0.045, 0.07, "1 000 000/S", (64, 41, 40)), "top_bar_battle_power")
-
         # FLOATING TIP
         # TODO Floating Tip
 
         # TRANSITION
-        def anim_transition(self):
-            try:
-                self.anim_speed
-            except AttributeError:
-                self.anim_speed = 0
-
-            if self.position_float[1] < -0.25:
-                self.move_y(0.001 * self.anim_speed)
-                self.anim_speed *= 1.1
-            elif self.anim_speed != 0:
-                self.move_to(0, 0)
-                self.anim_speed = 0
-                self.emit.append(Emit("Transition", []))
-
-        self.new_comp(Solid(0, -1.502, 1, 1.5, (34, 34, 34, 255), False, anim_transition), "AnimTransition")
+        self.new_comp(Solid(0, -1.502, 1, 1.5, (34, 34, 34, 255), False), "AnimTransition")
 
         # INITIAL TRANSITION
-        def anim_init_transition(self):
-            try:
-                self.anim_speed
-            except AttributeError:
-                self.anim_speed = 1
-
-            if self.position_float[1] < 1.1:
-                self.move_y(0.001 * self.anim_speed)
-                self.anim_speed *= 1.1
-            elif self.anim_speed != 0:
-                self.anim_speed = 0
-
-        self.new_comp(Solid(0, 0, 1, 1, (34, 34, 34, 255), False, anim_init_transition), "AnimInitTransition")
+        self.new_comp(Solid(0, 0, 1, 1, (34, 34, 34, 255), False), "AnimInitTransition")
 
     def on_scene_switch(self):
         self.scene_transition = None
 
-        self.get_comp("AnimInitTransition").move_to(0, 0)
-        self.get_comp("AnimInitTransition").anim_speed = 1
+        self.slide("AnimInitTransition", (0, 0), (0, 1.1), 0.8, ease_in)
 
+        self.tweens.cancel(("AnimTransition", "position"))
         self.get_comp("AnimTransition").move_to(0, -1.502)
-        self.get_comp("AnimTransition").anim_speed = 0
 
-    def handel_emit(self, emit: Emit):
-        if emit.name == "HoverWindow":
-            pass
-        if emit.name == "BeginTransition":
+    def create_events(self) -> None:
+        def begin_transition(emit: Emit):
             self.custom_switch_scene(emit.data[0])
             self.scene_transition_n_skip = emit.data[1]
-        elif emit.name == "Transition":
+        def transition(emit: Emit):
             self.scene_manager_link.switch_scene(self.scene_transition, self.scene_transition_n_skip)
             self.scene_transition = None
             self.scene_transition_n_skip = None
 
-    def update(self, dt: float) -> None:
-        super().update(dt)
-        self.game_data.update()
+        self.events.register("BeginTransition", begin_transition)
+        self.events.register("Transition", transition)
 
-        # TOP BAR
-        self.get_comp("top_bar_housing").change_text(int_smart_str(self.game_data.housing))
-        self.get_comp("top_bar_population").change_text(int_smart_str(self.game_data.population))
-        self.get_comp("top_bar_food").change_text(int_smart_str(self.game_data.food))
-        if self.game_data.food == 0 and self.get_comp("top_bar_food").color != (200, 0, 0, 255):
-            self.get_comp("top_bar_food").color = (200, 0, 0, 255)
-            self.get_comp("top_bar_food").draw()
-        elif self.game_data.food > 0 and self.get_comp("top_bar_food").color != (64, 41, 40, 255):
-            self.get_comp("top_bar_food").color = (64, 41, 40, 255)
-            self.get_comp("top_bar_food").draw()
-        self.get_comp("top_bar_free_population").change_text(int_smart_str(self.game_data.free_population))
-        if self.game_data.free_population < 0 and self.get_comp("top_bar_free_population").color != (200, 0, 0, 255):
-            self.get_comp("top_bar_free_population").color = (200, 0, 0, 255)
-            self.get_comp("top_bar_free_population").draw()
-        elif self.game_data.free_population > 0 and self.get_comp("top_bar_free_population").color != (64, 41, 40, 255):
-            self.get_comp("top_bar_free_population").color = (64, 41, 40, 255)
-            self.get_comp("top_bar_free_population").draw()
-        self.get_comp("top_bar_ascention").change_text(int_smart_str(self.game_data.ascention))
-        self.get_comp("top_bar_battle_power").change_text(int_smart_str(self.game_data.battle_power))
+    def register_shop(self, name: str, cost_scale: float, action: callable) -> None:
+        """shop buttons emit their own id, the cost is raised by cost_scale before action runs"""
+        def buy(emit: Emit):
+            component_shop_update_cost(self.get_comp(name), cost_scale)
+            action()
+        self.events.register(name, buy)
 
+    def bind_resources(self, names: list[str]) -> None:
+        """binds the resource_<name> labels of the extra panel"""
+        for name in names:
+            self.bind_text("resource_" + name, ["resource." + name], lambda name=name: int_smart_str(self.game_data.resource_get(name)))
+
+class SceneHud(SceneBase):
+    """top info bar shared by all game scenes, SceneManager owns it and every game scene draws it on top"""
+    def __init__(self) -> None:
+        super().__init__("hud")
+
+    def create(self) -> None:
+        # TOP INFO BAR
+        x, spacing = 0.58, 0.032
+        self.new_comp(Image(x, 0, 0.1, IMAGE_TOP_BAR_BAR, False), static=True)
+        x += +0.01
+        self.new_comp(Image(x, 0.045, 0.07, IMAGE_TOP_BAR_HOUSING, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x+spacing, 0.045, 0.07, "1 000 000", (64, 41, 40)), "top_bar_housing")
+        self.new_comp(Image(x+spacing*2, 0.045, 0.07, IMAGE_TOP_BAR_POPULATION, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x+spacing*3, 0.045, 0.07, "1 000 000", (64, 41, 40)), "top_bar_population")
+        self.new_comp(Image(x+spacing*4, 0.045, 0.07, IMAGE_TOP_BAR_FOOD, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x+spacing*5, 0.045, 0.07, "1 000 000", (64, 41, 40)), "top_bar_food")
+        self.new_comp(Image(x+spacing*6, 0.045, 0.07, IMAGE_TOP_BAR_FREE_POPULATION, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x+spacing*7, 0.045, 0.07, "1 000 000", (64, 41, 40)), "top_bar_free_population")
+        self.new_comp(Image(x+spacing*8, 0.045, 0.07, IMAGE_TOP_BAR_ASCENTION, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x+spacing*9, 0.045, 0.07, "1 000 000", (64, 41, 40)), "top_bar_ascention")
+        self.new_comp(Image(x+spacing*10, 0.045, 0.1, IMAGE_TOP_BAR_BREAK), static=True)
+        x += 0.01
+        self.new_comp(Image(x+spacing*10, 0.045, 0.07, IMAGE_TOP_BAR_BATTLE_POWER, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x+spacing*11, 0.045, 0.07, "1 000 000/S", (64, 41, 40)), "top_bar_battle_power")
+
+    def create_bindings(self) -> None:
+        # TOP BAR
+        def food_color():
+            component = self.get_comp("top_bar_food")
+            if self.game_data.food == 0 and component.color != (200, 0, 0, 255):
+                component.color = (200, 0, 0, 255)
+                component.draw()
+            elif self.game_data.food > 0 and component.color != (64, 41, 40, 255):
+                component.color = (64, 41, 40, 255)
+                component.draw()
+        def free_population_color():
+            component = self.get_comp("top_bar_free_population")
+            if self.game_data.free_population < 0 and component.color != (200, 0, 0, 255):
+                component.color = (200, 0, 0, 255)
+                component.draw()
+            elif self.game_data.free_population > 0 and component.color != (64, 41, 40, 255):
+                component.color = (64, 41, 40, 255)
+                component.draw()
+
+        for field in ["housing", "population", "food", "free_population", "ascention", "battle_power"]:
+            self.bind_text("top_bar_" + field, [field], lambda field=field: int_smart_str(getattr(self.game_data, field)))
+        self.bind(["food"], food_color)
+        self.bind(["free_population"], free_population_color)
 
 class SceneGameBuild(SceneGameBase):
     def __init__(self) -> None:
@@ -957,127 +1091,104 @@ class SceneGameBuild(SceneGameBase):
 
     def create(self) -> None:
         # BG
-        self.new_comp(Image(0, 0, 1, img_path("Bg//grass.png"), False))
+        self.new_comp(Image(0, 0, 1, img_path("Bg//grass.png"), False), static=True)
 
         # CLICKERS
         x = 0.52
         def tree_click(self):
-            self.emit.append(Emit("gather_wood", []))
-        self.new_comp(ButtonImage(x, 0.25, 0.4, img_path("Game\\tree_cluster.png"), tree_click))
-        self.new_comp(Text(x, 0.25, 0.12, "1000000"), "click_wood")
+            self.send(Emit("gather_wood", []))
+        self.new_comp(ButtonImage(x, 0.25, 0.4, img_path("Game/tree_cluster.png"), tree_click), static=True)
+        self.new_comp(NumberText(x, 0.25, 0.12, "1000000"), "click_wood")
         def stone_click(self):
-            self.emit.append(Emit("gather_stone", []))
-        self.new_comp(ButtonImage(x, 0.75, 0.4, img_path("Game\\stone_cluster.png"), stone_click))
-        self.new_comp(Text(x, 0.75, 0.12, "1000000"), "click_stone")
+            self.send(Emit("gather_stone", []))
+        self.new_comp(ButtonImage(x, 0.75, 0.4, img_path("Game/stone_cluster.png"), stone_click), static=True)
+        self.new_comp(NumberText(x, 0.75, 0.12, "1000000"), "click_stone")
         def food_click(self):
-            self.emit.append(Emit("gather_food", []))
-        self.new_comp(ButtonImage(x-0.05, 0.5, 0.4, img_path("Game\\wheat_patch.png"), food_click))
-        self.new_comp(Text(x-0.05, 0.5, 0.12, "1000000"), "click_food")
+            self.send(Emit("gather_food", []))
+        self.new_comp(ButtonImage(x-0.05, 0.5, 0.4, img_path("Game/wheat_patch.png"), food_click), static=True)
+        self.new_comp(NumberText(x-0.05, 0.5, 0.12, "1000000"), "click_food")
 
         # EXTRA PANEL
         # EXTRA PANEL RESOURCES
-        self.new_comp(Image(0.58, 0.2, 0.9, IMAGE_EXTRA_PANEL, False))
+        self.new_comp(Image(0.58, 0.2, 0.9, IMAGE_EXTRA_PANEL, False), static=True)
         x, y, spacing = 0.6, 0.28, 0.032
-        self.new_comp(Image(x , y, 0.1, IMAGE_ICON_WOOD, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x+spacing, y, 0.07, "1 000 000", (64, 41, 40)), "resource_wood")
-        self.new_comp(Image(x+spacing*2, y, 0.1, IMAGE_ICON_STONE, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x+spacing*3, y, 0.07, "1 000 000", (64, 41, 40)), "resource_stone")
-        self.new_comp(Image(x + spacing * 4, y, 0.1, IMAGE_ICON_FIBER, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 5, y, 0.07, "1 000 000", (64, 41, 40)), "resource_fiber")
-        self.new_comp(Image(x + spacing * 6, y, 0.1, IMAGE_ICON_IRON, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 7, y, 0.07, "1 000 000", (64, 41, 40)), "resource_iron")
-        self.new_comp(Image(x + spacing * 8, y, 0.1, IMAGE_ICON_STEEL, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 9, y, 0.07, "1 000 000", (64, 41, 40)), "resource_steel")
-        self.new_comp(Image(x + spacing * 10, y, 0.1, IMAGE_ICON_KILLS, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 11, y, 0.07, "1 000 000", (64, 41, 40)), "resource_kills")
+        self.new_comp(Image(x , y, 0.1, IMAGE_ICON_WOOD, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x+spacing, y, 0.07, "1 000 000", (64, 41, 40)), "resource_wood")
+        self.new_comp(Image(x+spacing*2, y, 0.1, IMAGE_ICON_STONE, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x+spacing*3, y, 0.07, "1 000 000", (64, 41, 40)), "resource_stone")
+        self.new_comp(Image(x + spacing * 4, y, 0.1, IMAGE_ICON_FIBER, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 5, y, 0.07, "1 000 000", (64, 41, 40)), "resource_fiber")
+        self.new_comp(Image(x + spacing * 6, y, 0.1, IMAGE_ICON_IRON, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 7, y, 0.07, "1 000 000", (64, 41, 40)), "resource_iron")
+        self.new_comp(Image(x + spacing * 8, y, 0.1, IMAGE_ICON_STEEL, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 9, y, 0.07, "1 000 000", (64, 41, 40)), "resource_steel")
+        self.new_comp(Image(x + spacing * 10, y, 0.1, IMAGE_ICON_KILLS, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 11, y, 0.07, "1 000 000", (64, 41, 40)), "resource_kills")
         # EXTRA PANEL BUTTONS
         size = 0.15
         x, y = 0.59, 0.36
         # housing
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\housing.png"), ["wood", "wood", 10, "stone", "stone", 10], "hello", "shop_housing"), "shop_housing")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\housing_upgrade.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_housing_upgrade", (1, 0)), "shop_housing_upgrade")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/housing.png"), ["wood", "wood", 10, "stone", "stone", 10], "hello", "shop_housing"), "shop_housing")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/housing_upgrade.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_housing_upgrade", (1, 0)), "shop_housing_upgrade")
         # food
-        self.new_comp(ShopButton(x, y , size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\food.png"),["wood", "wood", 10, "fiber", "fiber", 10], "hello", "shop_food", (0, 1)), "shop_food")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\food_upgrade.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_food_upgrade", (1, 1)),"shop_food_upgrade")
+        self.new_comp(ShopButton(x, y , size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/food.png"),["wood", "wood", 10, "fiber", "fiber", 10], "hello", "shop_food", (0, 1)), "shop_food")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/food_upgrade.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_food_upgrade", (1, 1)),"shop_food_upgrade")
         # wood
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\wood.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_wood", (0, 2)), "shop_wood")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\wood_upgrade.png"),["fiber", "fiber", 10, "steel", "steel", 10], "hello", "shop_wood_upgrade", (1, 2)),"shop_wood_upgrade")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/wood.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_wood", (0, 2)), "shop_wood")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/wood_upgrade.png"),["fiber", "fiber", 10, "steel", "steel", 10], "hello", "shop_wood_upgrade", (1, 2)),"shop_wood_upgrade")
         # wood
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\stone.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_stone", (0, 3)), "shop_stone")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\stone_upgrade.png"),["iron", "iron", 10, "steel", "steel", 10], "hello", "shop_stone_upgrade", (1, 3)),"shop_stone_upgrade")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/stone.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_stone", (0, 3)), "shop_stone")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/stone_upgrade.png"),["iron", "iron", 10, "steel", "steel", 10], "hello", "shop_stone_upgrade", (1, 3)),"shop_stone_upgrade")
         # mouse
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\mouse.png"),["steel", "steel", 10, "skull", "kills", 10], "hello", "shop_mouse", (2, 3)),"shop_mouse")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/mouse.png"),["steel", "steel", 10, "skull", "kills", 10], "hello", "shop_mouse", (2, 3)),"shop_mouse")
 
         # SUPER
         super().create()
 
-    def handel_emit(self, emit: Emit):
-        super().handel_emit(emit)
+    def create_events(self) -> None:
+        super().create_events()
 
-        if emit.name == "gather_wood":
+        # CLICKERS
+        def gather_wood(emit: Emit):
             self.game_data.resource_add("wood", self.game_data.click_wood)
             self.game_data.stat_add("wood_clicked", self.game_data.click_wood)
-        elif emit.name == "gather_stone":
+        def gather_stone(emit: Emit):
             self.game_data.resource_add("stone", self.game_data.click_stone)
             self.game_data.stat_add("stone_clicked", self.game_data.click_wood)
-        elif emit.name == "gather_food":
+        def gather_food(emit: Emit):
             self.game_data.food += self.game_data.click_food
             self.game_data.stat_add("food_clicked", self.game_data.click_wood)
             self.game_data.stat_add("food_gathered", self.game_data.click_wood)
 
-        elif emit.name == "shop_housing":
-            comp = self.get_comp("shop_housing")
-            component_shop_update_cost(comp, 1.5)
+        self.events.register("gather_wood", gather_wood)
+        self.events.register("gather_stone", gather_stone)
+        self.events.register("gather_food", gather_food)
+
+        # SHOP
+        def housing():
             self.game_data.housing += self.game_data.build_housing_gain
-        elif emit.name == "shop_housing_upgrade":
-            comp = self.get_comp("shop_housing_upgrade")
-            component_shop_update_cost(comp, 3)
+        def housing_upgrade():
             self.game_data.build_housing_gain *= 2
             self.game_data.housing *= 2
-        elif emit.name == "shop_food":
-            comp = self.get_comp("shop_food")
-            component_shop_update_cost(comp, 1.5)
-            self.game_data.production_build("food")
-        elif emit.name == "shop_food_upgrade":
-            comp = self.get_comp("shop_food_upgrade")
-            component_shop_update_cost(comp, 3)
-            self.game_data.production_upgrade("food")
-        elif emit.name == "shop_wood":
-            comp = self.get_comp("shop_wood")
-            component_shop_update_cost(comp, 1.5)
-            self.game_data.production_build("wood")
-        elif emit.name == "shop_wood_upgrade":
-            comp = self.get_comp("shop_wood_upgrade")
-            component_shop_update_cost(comp, 3)
-            self.game_data.production_upgrade("wood")
-        elif emit.name == "shop_stone":
-            comp = self.get_comp("shop_stone")
-            component_shop_update_cost(comp, 1.5)
-            self.game_data.production_build("stone")
-        elif emit.name == "shop_stone_upgrade":
-            comp = self.get_comp("shop_stone_upgrade")
-            component_shop_update_cost(comp, 3)
-            self.game_data.production_upgrade("stone")
-        elif emit.name == "shop_mouse":
-            comp = self.get_comp("shop_mouse")
-            component_shop_update_cost(comp, 2)
+        def mouse():
             self.game_data.click_food *= 2
             self.game_data.click_wood *= 2
             self.game_data.click_stone *= 2
 
-    def update(self, dt: float) -> None:
-        super().update(dt)
+        self.register_shop("shop_housing", 1.5, housing)
+        self.register_shop("shop_housing_upgrade", 3, housing_upgrade)
+        for production in ["food", "wood", "stone"]:
+            self.register_shop("shop_" + production, 1.5, lambda production=production: self.game_data.production_build(production))
+            self.register_shop("shop_" + production + "_upgrade", 3, lambda production=production: self.game_data.production_upgrade(production))
+        self.register_shop("shop_mouse", 2, mouse)
 
-        self.get_comp("resource_wood").change_text(int_smart_str(self.game_data.resource_get("wood")))
-        self.get_comp("resource_stone").change_text(int_smart_str(self.game_data.resource_get("stone")))
-        self.get_comp("resource_iron").change_text(int_smart_str(self.game_data.resource_get("iron")))
-        self.get_comp("resource_fiber").change_text(int_smart_str(self.game_data.resource_get("fiber")))
-        self.get_comp("resource_steel").change_text(int_smart_str(self.game_data.resource_get("steel")))
-        self.get_comp("resource_kills").change_text(int_smart_str(self.game_data.resource_get("kills")))
+    def create_bindings(self) -> None:
+        super().create_bindings()
 
-        self.get_comp("click_wood").change_text("+" + int_smart_str(self.game_data.click_wood))
-        self.get_comp("click_stone").change_text("+" + int_smart_str(self.game_data.click_stone))
-        self.get_comp("click_food").change_text("+" + int_smart_str(self.game_data.click_food))
+        self.bind_resources(["wood", "stone", "iron", "fiber", "steel", "kills"])
+
+        for name in ["wood", "stone", "food"]:
+            self.bind_text("click_" + name, ["click_" + name], lambda name=name: "+" + int_smart_str(getattr(self.game_data, "click_" + name)))
 
 class SceneGameWork(SceneGameBase):
     def __init__(self) -> None:
@@ -1085,110 +1196,89 @@ class SceneGameWork(SceneGameBase):
 
     def create(self) -> None:
         # BG
-        self.new_comp(Image(0, 0, 1, img_path("Bg//stone.png"), False))
+        self.new_comp(Image(0, 0, 1, img_path("Bg//stone.png"), False), static=True)
 
         # CLICKERS
         x = 0.52
         def tree_click(self):
-            self.emit.append(Emit("work_wood", []))
-        self.new_comp(ButtonImage(x, 0.25, 0.4, img_path("Game\\axe.png"), tree_click))
-        self.new_comp(Text(x, 0.25, 0.1, "1000000"), "click_fiber")
+            self.send(Emit("work_wood", []))
+        self.new_comp(ButtonImage(x, 0.25, 0.4, img_path("Game/axe.png"), tree_click), static=True)
+        self.new_comp(NumberText(x, 0.25, 0.1, "1000000"), "click_fiber")
         def stone_click(self):
-            self.emit.append(Emit("work_stone", []))
-        self.new_comp(ButtonImage(x, 0.75, 0.4, img_path("Game\\pickaxe.png"), stone_click))
-        self.new_comp(Text(x, 0.75, 0.1, "1000000"), "click_iron")
+            self.send(Emit("work_stone", []))
+        self.new_comp(ButtonImage(x, 0.75, 0.4, img_path("Game/pickaxe.png"), stone_click), static=True)
+        self.new_comp(NumberText(x, 0.75, 0.1, "1000000"), "click_iron")
 
         # EXTRA PANEL
-        self.new_comp(Image(0.58, 0.2, 0.9, IMAGE_EXTRA_PANEL, False))
+        self.new_comp(Image(0.58, 0.2, 0.9, IMAGE_EXTRA_PANEL, False), static=True)
         x, y, spacing = 0.6, 0.28, 0.032
-        self.new_comp(Image(x, y, 0.1, IMAGE_ICON_WOOD, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing, y, 0.07, "1 000 000", (64, 41, 40)), "resource_wood")
-        self.new_comp(Image(x + spacing * 2, y, 0.1, IMAGE_ICON_STONE, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 3, y, 0.07, "1 000 000", (64, 41, 40)), "resource_stone")
-        self.new_comp(Image(x + spacing * 4, y, 0.1, IMAGE_ICON_FIBER, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 5, y, 0.07, "1 000 000", (64, 41, 40)), "resource_fiber")
-        self.new_comp(Image(x + spacing * 6, y, 0.1, IMAGE_ICON_IRON, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 7, y, 0.07, "1 000 000", (64, 41, 40)), "resource_iron")
-        self.new_comp(Image(x + spacing * 8, y, 0.1, IMAGE_ICON_STEEL, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 9, y, 0.07, "1 000 000", (64, 41, 40)), "resource_steel")
-        self.new_comp(Image(x + spacing * 10, y, 0.1, IMAGE_ICON_KILLS, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 11, y, 0.07, "1 000 000", (64, 41, 40)), "resource_kills")
+        self.new_comp(Image(x, y, 0.1, IMAGE_ICON_WOOD, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing, y, 0.07, "1 000 000", (64, 41, 40)), "resource_wood")
+        self.new_comp(Image(x + spacing * 2, y, 0.1, IMAGE_ICON_STONE, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 3, y, 0.07, "1 000 000", (64, 41, 40)), "resource_stone")
+        self.new_comp(Image(x + spacing * 4, y, 0.1, IMAGE_ICON_FIBER, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 5, y, 0.07, "1 000 000", (64, 41, 40)), "resource_fiber")
+        self.new_comp(Image(x + spacing * 6, y, 0.1, IMAGE_ICON_IRON, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 7, y, 0.07, "1 000 000", (64, 41, 40)), "resource_iron")
+        self.new_comp(Image(x + spacing * 8, y, 0.1, IMAGE_ICON_STEEL, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 9, y, 0.07, "1 000 000", (64, 41, 40)), "resource_steel")
+        self.new_comp(Image(x + spacing * 10, y, 0.1, IMAGE_ICON_KILLS, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 11, y, 0.07, "1 000 000", (64, 41, 40)), "resource_kills")
         # EXTRA PANEL BUTTONS
         size = 0.15
         x, y = 0.59, 0.36
         # fiber
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\fiber.png"),["wood", "wood", 10, "stone", "stone", 10], "hello", "shop_fiber"), "shop_fiber")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\fiber_upgrade.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_fiber_upgrade", (1, 0)),"shop_fiber_upgrade")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/fiber.png"),["wood", "wood", 10, "stone", "stone", 10], "hello", "shop_fiber"), "shop_fiber")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/fiber_upgrade.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_fiber_upgrade", (1, 0)),"shop_fiber_upgrade")
         # iron
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\iron.png"),["wood", "wood", 10, "fiber", "fiber", 10], "hello", "shop_iron", (0, 1)), "shop_iron")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\iron_upgrade.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_iron_upgrade", (1, 1)),"shop_iron_upgrade")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/iron.png"),["wood", "wood", 10, "fiber", "fiber", 10], "hello", "shop_iron", (0, 1)), "shop_iron")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/iron_upgrade.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_iron_upgrade", (1, 1)),"shop_iron_upgrade")
         # steel
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\steel.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_steel", (0, 2)), "shop_steel")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\steel_upgrade.png"),["fiber", "fiber", 10, "steel", "steel", 10], "hello", "shop_steel_upgrade", (1, 2)),"shop_steel_upgrade")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/steel.png"),["fiber", "fiber", 10, "iron", "iron", 10], "hello", "shop_steel", (0, 2)), "shop_steel")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/steel_upgrade.png"),["fiber", "fiber", 10, "steel", "steel", 10], "hello", "shop_steel_upgrade", (1, 2)),"shop_steel_upgrade")
         # mouse
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\mouse.png"),["steel", "steel", 10, "skull", "kills", 10], "hello", "shop_mouse", (0, 3)),"shop_mouse")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/mouse.png"),["steel", "steel", 10, "skull", "kills", 10], "hello", "shop_mouse", (0, 3)),"shop_mouse")
 
         # SUPER
         super().create()
 
-    def handel_emit(self, emit: Emit):
-        super().handel_emit(emit)
+    def create_events(self) -> None:
+        super().create_events()
 
-        if emit.name == "work_wood":
+        # WORKERS
+        def work_wood(emit: Emit):
             if self.game_data.resource_get("wood") >= self.game_data.cost_fiber:
                 self.game_data.resource_take("wood", self.game_data.cost_fiber)
                 self.game_data.resource_add("fiber", self.game_data.click_fiber)
                 self.game_data.stat_add("fiber_clicked", self.game_data.click_wood)
-        elif emit.name == "work_stone":
+        def work_stone(emit: Emit):
             if self.game_data.resource_get("stone") >= self.game_data.cost_iron:
                 self.game_data.resource_take("stone", self.game_data.cost_iron)
                 self.game_data.resource_add("iron", self.game_data.click_iron)
                 self.game_data.stat_add("iron_clicked", self.game_data.click_wood)
 
-        elif emit.name == "shop_fiber":
-            comp = self.get_comp("shop_fiber")
-            component_shop_update_cost(comp, 1.5)
-            self.game_data.production_build("fiber")
-        elif emit.name == "shop_fiber_upgrade":
-            comp = self.get_comp("shop_fiber_upgrade")
-            component_shop_update_cost(comp, 3)
-            self.game_data.production_upgrade("fiber")
-        elif emit.name == "shop_iron":
-            comp = self.get_comp("shop_iron")
-            component_shop_update_cost(comp, 1.5)
-            self.game_data.production_build("iron")
-        elif emit.name == "shop_iron_upgrade":
-            comp = self.get_comp("shop_iron_upgrade")
-            component_shop_update_cost(comp, 3)
-            self.game_data.production_upgrade("iron")
-        elif emit.name == "shop_steel":
-            comp = self.get_comp("shop_steel")
-            component_shop_update_cost(comp, 1.5)
-            self.game_data.production_build("steel")
-        elif emit.name == "shop_steel_upgrade":
-            comp = self.get_comp("shop_steel_upgrade")
-            component_shop_update_cost(comp, 3)
-            self.game_data.production_upgrade("steel")
-        elif emit.name == "shop_mouse":
-            comp = self.get_comp("shop_mouse")
-            component_shop_update_cost(comp, 2)
+        self.events.register("work_wood", work_wood)
+        self.events.register("work_stone", work_stone)
+
+        # SHOP
+        def mouse():
             self.game_data.click_fiber *= 2
             self.game_data.cost_fiber = int(round(self.game_data.cost_fiber * 1.9))
             self.game_data.click_iron *= 2
             self.game_data.cost_iron = int(round(self.game_data.cost_iron * 1.9))
 
-    def update(self, dt: float) -> None:
-        super().update(dt)
+        for production in ["fiber", "iron", "steel"]:
+            self.register_shop("shop_" + production, 1.5, lambda production=production: self.game_data.production_build(production))
+            self.register_shop("shop_" + production + "_upgrade", 3, lambda production=production: self.game_data.production_upgrade(production))
+        self.register_shop("shop_mouse", 2, mouse)
+
+    def create_bindings(self) -> None:
+        super().create_bindings()
 
-        self.get_comp("resource_wood").change_text(int_smart_str(self.game_data.resource_get("wood")))
-        self.get_comp("resource_stone").change_text(int_smart_str(self.game_data.resource_get("stone")))
-        self.get_comp("resource_iron").change_text(int_smart_str(self.game_data.resource_get("iron")))
-        self.get_comp("resource_fiber").change_text(int_smart_str(self.game_data.resource_get("fiber")))
-        self.get_comp("resource_steel").change_text(int_smart_str(self.game_data.resource_get("steel")))
-        self.get_comp("resource_kills").change_text(int_smart_str(self.game_data.resource_get("kills")))
+        self.bind_resources(["wood", "stone", "iron", "fiber", "steel", "kills"])
 
-        self.get_comp("click_fiber").change_text("-" + int_smart_str(self.game_data.cost_fiber) + "|+" + int_smart_str(self.game_data.click_fiber))
-        self.get_comp("click_iron").change_text("-" + int_smart_str(self.game_data.cost_iron) + "|+" + int_smart_str(self.game_data.click_iron))
+        for name in ["fiber", "iron"]:
+            self.bind_text("click_" + name, ["cost_" + name, "click_" + name], lambda name=name: "-" + int_smart_str(getattr(self.game_data, "cost_" + name)) + "|+" + int_smart_str(getattr(self.game_data, "click_" + name)))
 
 class SceneGameBattle(SceneGameBase):
     def __init__(self) -> None:
@@ -1196,45 +1286,45 @@ class SceneGameBattle(SceneGameBase):
 
     def create(self) -> None:
         # BG
-        self.new_comp(Image(0, 0, 1, img_path("Bg//forest.png"), False))
+        self.new_comp(Image(0, 0, 1, img_path("Bg//forest.png"), False), static=True)
 
         # CLICKERS
         x = 0.52
         def elements_click(self):
-            self.emit.append(Emit("take_elements", []))
-        self.new_comp(ButtonImage(x, 0.5, 0.4, img_path("Game\\elementals.png"), elements_click))
-        self.new_comp(Text(x, 0.5, 0.1, "1000000"), "click_elements")
+            self.send(Emit("take_elements", []))
+        self.new_comp(ButtonImage(x, 0.5, 0.4, img_path("Game/elementals.png"), elements_click), static=True)
+        self.new_comp(NumberText(x, 0.5, 0.1, "1000000"), "click_elements")
 
         # EXTRA PANEL
-        self.new_comp(Image(0.58, 0.2, 0.9, IMAGE_EXTRA_PANEL, False))
+        self.new_comp(Image(0.58, 0.2, 0.9, IMAGE_EXTRA_PANEL, False), static=True)
         x, y, spacing = 0.6, 0.28, 0.032
-        self.new_comp(Image(x, y, 0.1, IMAGE_ICON_WOOD, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing, y, 0.07, "1 000 000", (64, 41, 40)), "resource_wood")
-        self.new_comp(Image(x + spacing * 2, y, 0.1, IMAGE_ICON_STONE, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 3, y, 0.07, "1 000 000", (64, 41, 40)), "resource_stone")
-        self.new_comp(Image(x + spacing * 4, y, 0.1, IMAGE_ICON_FIBER, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 5, y, 0.07, "1 000 000", (64, 41, 40)), "resource_iron")
-        self.new_comp(Image(x + spacing * 6, y, 0.1, IMAGE_ICON_IRON, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 7, y, 0.07, "1 000 000", (64, 41, 40)), "resource_fiber")
-        self.new_comp(Image(x + spacing * 8, y, 0.1, IMAGE_ICON_KILLS, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 9, y, 0.07, "1 000 000", (64, 41, 40)), "resource_kills")
-        self.new_comp(Image(x + spacing * 10, y, 0.1, IMAGE_ICON_ELEMENTS, color=(0, 0, 0, 255)))
-        self.new_comp(Text(x + spacing * 11, y, 0.07, "1 000 000", (64, 41, 40)), "resource_elements")
+        self.new_comp(Image(x, y, 0.1, IMAGE_ICON_WOOD, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing, y, 0.07, "1 000 000", (64, 41, 40)), "resource_wood")
+        self.new_comp(Image(x + spacing * 2, y, 0.1, IMAGE_ICON_STONE, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 3, y, 0.07, "1 000 000", (64, 41, 40)), "resource_stone")
+        self.new_comp(Image(x + spacing * 4, y, 0.1, IMAGE_ICON_FIBER, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 5, y, 0.07, "1 000 000", (64, 41, 40)), "resource_iron")
+        self.new_comp(Image(x + spacing * 6, y, 0.1, IMAGE_ICON_IRON, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 7, y, 0.07, "1 000 000", (64, 41, 40)), "resource_fiber")
+        self.new_comp(Image(x + spacing * 8, y, 0.1, IMAGE_ICON_KILLS, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 9, y, 0.07, "1 000 000", (64, 41, 40)), "resource_kills")
+        self.new_comp(Image(x + spacing * 10, y, 0.1, IMAGE_ICON_ELEMENTS, color=(0, 0, 0, 255)), static=True)
+        self.new_comp(NumberText(x + spacing * 11, y, 0.07, "1 000 000", (64, 41, 40)), "resource_elements")
         # EXTRA PANEL BUTTONS
         size = 0.15
         x, y = 0.59, 0.36
         # elements
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\elements.png"),["wood", "wood", 10, "stone", "stone", 10], "hello", "shop_elements"), "shop_elements")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\elements_upgrade.png"),["fiber", "fiber", 10, "steel", "steel", 10], "hello", "shop_elements_upgrade", (1, 0)),"shop_elements_upgrade")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/elements.png"),["wood", "wood", 10, "stone", "stone", 10], "hello", "shop_elements"), "shop_elements")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/elements_upgrade.png"),["fiber", "fiber", 10, "steel", "steel", 10], "hello", "shop_elements_upgrade", (1, 0)),"shop_elements_upgrade")
         # mouse
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\mouse.png"),["steel", "steel", 10, "skull", "kills", 10], "hello", "shop_mouse", (2, 0)),"shop_mouse")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/mouse.png"),["steel", "steel", 10, "skull", "kills", 10], "hello", "shop_mouse", (2, 0)),"shop_mouse")
         # units
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\unit1.png"),["elements", "elements", 10, "wood", "wood", 10], "hello", "shop_unit1", (0, 1)),"shop_unit1")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\unit2.png"),["elements", "elements", 10, "stone", "stone", 10], "hello", "shop_unit2", (1, 1)),"shop_unit2")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\unit3.png"),["elements", "elements", 10, "fiber", "fiber", 10], "hello", "shop_unit3", (0, 2)),"shop_unit3")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\unit4.png"),["elements", "elements", 10, "iron", "iron", 10], "hello", "shop_unit4", (1, 2)),"shop_unit4")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\unit5.png"),["elements", "elements", 10, "steel", "steel", 10], "hello", "shop_unit5", (0, 3)),"shop_unit5")
-        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game\\Shop\\unit6.png"),["elements", "elements", 10, "skull", "kills", 10], "hello", "shop_unit6", (1, 3)),"shop_unit6")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/unit1.png"),["elements", "elements", 10, "wood", "wood", 10], "hello", "shop_unit1", (0, 1)),"shop_unit1")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/unit2.png"),["elements", "elements", 10, "stone", "stone", 10], "hello", "shop_unit2", (1, 1)),"shop_unit2")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/unit3.png"),["elements", "elements", 10, "fiber", "fiber", 10], "hello", "shop_unit3", (0, 2)),"shop_unit3")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/unit4.png"),["elements", "elements", 10, "iron", "iron", 10], "hello", "shop_unit4", (1, 2)),"shop_unit4")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/unit5.png"),["elements", "elements", 10, "steel", "steel", 10], "hello", "shop_unit5", (0, 3)),"shop_unit5")
+        self.new_comp(ShopButton(x, y, size, IMAGE_SHOP_BUTTON, img_path("Game/Shop/unit6.png"),["elements", "elements", 10, "skull", "kills", 10], "hello", "shop_unit6", (1, 3)),"shop_unit6")
 
         # battle
         def hover(self, state):
@@ -1243,7 +1333,7 @@ class SceneGameBattle(SceneGameBase):
             else:
                 self.change_color((200, 0, 0))
         def click(self):
-            self.emit.append(Emit("battle_start", []))
+            self.send(Emit("battle_start", []))
         self.new_comp(ButtonText(0.25, 0.5, 0.2, "TO BATTLE", click,(255, 255, 255), hover_func=hover), "battle_button")
         self.new_comp(Text(0.25, 0.7, 0.1, "temp", (0, 0, 0)), "battle_chance")
         self.new_comp(Text(0.25, 0.7, 0.1, "temp", (0, 0, 0)), "battle_timer")
@@ -1251,51 +1341,32 @@ class SceneGameBattle(SceneGameBase):
         # SUPER
         super().create()
 
-    def handel_emit(self, emit: Emit):
-        super().handel_emit(emit)
+    def create_events(self) -> None:
+        super().create_events()
 
-        if emit.name == "take_elements":
+        # CLICKER
+        def take_elements(emit: Emit):
             self.game_data.resource_add("elements", self.game_data.click_elements)
             self.game_data.stat_add("elements_clicked", self.game_data.click_elements)
-        elif emit.name == "shop_elements":
-            comp = self.get_comp("shop_elements")
-            component_shop_update_cost(comp, 1.5)
-            self.game_data.production_build("elements")
-        elif emit.name == "shop_elements_upgrade":
-            comp = self.get_comp("shop_elements_upgrade")
-            component_shop_update_cost(comp, 2)
-            self.game_data.production_upgrade("elements")
-        elif emit.name == "shop_mouse":
-            comp = self.get_comp("shop_mouse")
-            component_shop_update_cost(comp, 2)
-            self.game_data.click_elements *= 2
 
-        elif emit.name == "shop_unit1":
-            comp = self.get_comp("shop_unit1")
-            component_shop_update_cost(comp, 1.2)
-            self.game_data.battle_power += 1
-        elif emit.name == "shop_unit2":
-            comp = self.get_comp("shop_unit2")
-            component_shop_update_cost(comp, 1.2)
-            self.game_data.battle_power += 2
-        elif emit.name == "shop_unit3":
-            comp = self.get_comp("shop_unit3")
-            component_shop_update_cost(comp, 1.2)
-            self.game_data.battle_power += 4
-        elif emit.name == "shop_unit4":
-            comp = self.get_comp("shop_unit4")
-            component_shop_update_cost(comp, 1.2)
-            self.game_data.battle_power += 8
-        elif emit.name == "shop_unit5":
-            comp = self.get_comp("shop_unit5")
-            component_shop_update_cost(comp, 1.2)
-            self.game_data.battle_power += 16
-        elif emit.name == "shop_unit6":
-            comp = self.get_comp("shop_unit6")
-            component_shop_update_cost(comp, 1.2)
-            self.game_data.battle_power += 32
-
-        elif emit.name == "battle_start":
+        self.events.register("take_elements", take_elements)
+
+        # SHOP
+        def mouse():
+            self.game_data.click_elements *= 2
+        def unit(power: int) -> callable:
+            def buy():
+                self.game_data.battle_power += power
+            return buy
+
+        self.register_shop("shop_elements", 1.5, lambda: self.game_data.production_build("elements"))
+        self.register_shop("shop_elements_upgrade", 2, lambda: self.game_data.production_upgrade("elements"))
+        self.register_shop("shop_mouse", 2, mouse)
+        for number, power in enumerate([1, 2, 4, 8, 16, 32], 1):
+            self.register_shop("shop_unit" + str(number), 1.2, unit(power))
+
+        # BATTLE
+        def battle_start(emit: Emit):
             if self.game_data.battle_timer == -1:
                 if self.get_comp("battle_button").text_content == "TO BATTLE":
                     self.get_comp("battle_button").change_text("IN BATTLE")
@@ -1304,32 +1375,35 @@ class SceneGameBattle(SceneGameBase):
                 else:
                     self.get_comp("battle_button").change_text("TO BATTLE")
 
-    def update(self, dt: float) -> None:
-        super().update(dt)
+        self.events.register("battle_start", battle_start)
 
-        self.get_comp("resource_wood").change_text(int_smart_str(self.game_data.resource_get("wood")))
-        self.get_comp("resource_stone").change_text(int_smart_str(self.game_data.resource_get("stone")))
-        self.get_comp("resource_iron").change_text(int_smart_str(self.game_data.resource_get("iron")))
-        self.get_comp("resource_fiber").change_text(int_smart_str(self.game_data.resource_get("fiber")))
-        self.get_comp("resource_kills").change_text(int_smart_str(self.game_data.resource_get("kills")))
-        self.get_comp("resource_elements").change_text(int_smart_str(self.game_data.resource_get("elements")))
+    def create_bindings(self) -> None:
+        super().create_bindings()
 
-        self.get_comp("click_elements").change_text("+" + int_smart_str(self.game_data.click_elements))
+        self.bind_resources(["wood", "stone", "iron", "fiber", "kills", "elements"])
 
+        self.bind_text("click_elements", ["click_elements"], lambda: "+" + int_smart_str(self.game_data.click_elements))
 
-        if self.game_data.battle_timer == -1:
-            self.get_comp("battle_chance").change_text("Success chance : " + str(int((self.game_data.battle_power / self.game_data.battle_targets) * 100)) + "/100")
-            self.get_comp("battle_timer").change_text("")
-        else:
-            self.get_comp("battle_chance").change_text("")
-            self.get_comp("battle_timer").change_text("Time left : " + str(int(self.game_data.battle_timer)) + " S")
+        # BATTLE
+        def battle_chance() -> str:
+            if self.game_data.battle_timer == -1:
+                return "Success chance : " + str(int((self.game_data.battle_power / self.game_data.battle_targets) * 100)) + "/100"
+            return ""
+        def battle_timer() -> str:
+            if self.game_data.battle_timer != -1:
+                return "Time left : " + str(int(self.game_data.battle_timer)) + " S"
+            return ""
+        def battle_last():
+            if self.game_data.battle_last != -1:
+                if self.game_data.battle_last == 0:
+                    self.get_comp("battle_button").change_text("You Lost")
+                else:
+                    self.get_comp("battle_button").change_text("You Won")
+                self.game_data.battle_last = -1
 
-        if self.game_data.battle_last != -1:
-            if self.game_data.battle_last == 0:
-                self.get_comp("battle_button").change_text("You Lost")
-            else:
-                self.get_comp("battle_button").change_text("You Won")
-            self.game_data.battle_last = -1
+        self.bind_text("battle_chance", ["battle_timer", "battle_power", "battle_targets"], battle_chance)
+        self.bind_text("battle_timer", ["battle_timer"], battle_timer)
+        self.bind(["battle_last"], battle_last)
 
 class SceneGameAscend(SceneGameBase):
     def __init__(self) -> None:
@@ -1337,15 +1411,15 @@ class SceneGameAscend(SceneGameBase):
 
     def create(self) -> None:
         # BG
-        self.new_comp(Image(0, 0, 1, img_path("Bg//gold.png"), False))
+        self.new_comp(Image(0, 0, 1, img_path("Bg//gold.png"), False), static=True)
 
         # EXTRA PANEL
-        self.new_comp(Image(0.58, 0.2, 0.9, IMAGE_EXTRA_PANEL, False))
-        self.new_comp(Text(0.59, 0.4, 0.1, "From population :", (0, 0, 0, 255), False))
-        self.new_comp(Text(0.59, 0.5, 0.1, "From resources :", (0, 0, 0, 255), False))
-        self.new_comp(Text(0.59, 0.6, 0.1, "From buildings :", (0, 0, 0, 255), False))
-        self.new_comp(Text(0.59, 0.7, 0.1, "From battles :", (0, 0, 0, 255), False))
-        self.new_comp(Text(0.59, 0.8, 0.1, "Combined :", (0, 0, 0, 255), False))
+        self.new_comp(Image(0.58, 0.2, 0.9, IMAGE_EXTRA_PANEL, False), static=True)
+        self.new_comp(Text(0.59, 0.4, 0.1, "From population :", (0, 0, 0, 255), False), static=True)
+        self.new_comp(Text(0.59, 0.5, 0.1, "From resources :", (0, 0, 0, 255), False), static=True)
+        self.new_comp(Text(0.59, 0.6, 0.1, "From buildings :", (0, 0, 0, 255), False), static=True)
+        self.new_comp(Text(0.59, 0.7, 0.1, "From battles :", (0, 0, 0, 255), False), static=True)
+        self.new_comp(Text(0.59, 0.8, 0.1, "Combined :", (0, 0, 0, 255), False), static=True)
 
         self.new_comp(Text(0.85, 0.4, 0.1, "temp", (0, 0, 0, 255), False), "population")
         self.new_comp(Text(0.85, 0.5, 0.1, "temp", (0, 0, 0, 255), False), "resources")
@@ -1359,32 +1433,34 @@ class SceneGameAscend(SceneGameBase):
             else:
                 self.change_color((0, 0, 0))
         def click(self):
-            self.emit.append(Emit("ascend", []))
+            self.send(Emit("ascend", []))
         self.new_comp(ButtonText(0.25, 0.5, 0.2, "ASCEND", click, (255, 255, 255), hover_func=hover),"ascend_button")
 
         # SUPER
         super().create()
 
-    def handel_emit(self, emit: Emit):
-        super().handel_emit(emit)
+    def create_events(self) -> None:
+        super().create_events()
 
-        if emit.name == "ascend":
+        def ascend(emit: Emit):
             self.game_data.ascend_now()
             self.scene_manager_link.switch_scene("game_build")
             self.scene_manager_link.shop_cost_reset()
 
-    def update(self, dt: float) -> None:
-        super().update(dt)
+        self.events.register("ascend", ascend)
 
-        #resources
-        #buildings
-        #battle
+    def create_bindings(self) -> None:
+        super().create_bindings()
 
-        self.get_comp("population").change_text(str(self.game_data.ascention_get("po")))
-        self.get_comp("resources").change_text(str(self.game_data.ascention_get("re")))
-        self.get_comp("buildings").change_text(str(self.game_data.ascention_get("bu")))
-        self.get_comp("battle").change_text(str(self.game_data.ascention_get("ba")))
-        self.get_comp("combined").change_text(str(self.game_data.ascention_get("all")))
+        sources = {
+            "population": ("po", ["population"]),
+            "resources" : ("re", ["resource"]),
+            "buildings" : ("bu", ["production"]),
+            "battle"    : ("ba", ["battle_power"]),
+            "combined"  : ("all", ["population", "resource", "production", "battle_power"])
+        }
+        for comp_id, (specific, fields) in sources.items():
+            self.bind_text(comp_id, fields, lambda specific=specific: str(self.game_data.ascention_get(specific)))
 
 class SceneGameStats(SceneGameBase):
     def __init__(self) -> None:
@@ -1392,12 +1468,12 @@ class SceneGameStats(SceneGameBase):
 
     def create(self) -> None:
         # BG
-        self.new_comp(Image(0, 0, 1, img_path("Bg//sand.png"), False))
+        self.new_comp(Image(0, 0, 1, img_path("Bg//sand.png"), False), static=True)
 
         # RESOURCES CLICKED
         x, y, size  = 0.1, 0.2, 0.08
         spacing = size
-        self.new_comp(Text(x, y, 0.12, "Clicked :", (0, 0, 0), False))
+        self.new_comp(Text(x, y, 0.12, "Clicked :", (0, 0, 0), False), static=True)
         self.new_comp(Text(x, y + spacing * 2, size, "temp", (0, 0, 0), False), "clicked_wood")
         self.new_comp(Text(x, y + spacing * 3, size, "temp", (0, 0, 0), False), "clicked_stone")
         self.new_comp(Text(x, y + spacing * 4, size, "temp", (0, 0, 0), False), "clicked_fiber")
@@ -1408,7 +1484,7 @@ class SceneGameStats(SceneGameBase):
         # RESOURCES GATHERED
         x, y, size = 0.4, 0.2, 0.08
         spacing = size
-        self.new_comp(Text(x, y, 0.12, "Gathered :", (0, 0, 0), False))
+        self.new_comp(Text(x, y, 0.12, "Gathered :", (0, 0, 0), False), static=True)
         self.new_comp(Text(x, y + spacing * 2, size, "temp", (0, 0, 0), False), "gathered_wood")
         self.new_comp(Text(x, y + spacing * 3, size, "temp", (0, 0, 0), False), "gathered_stone")
         self.new_comp(Text(x, y + spacing * 4, size, "temp", (0, 0, 0), False), "gathered_fiber")
@@ -1420,7 +1496,7 @@ class SceneGameStats(SceneGameBase):
         # BUILDINGS BUILD
         x, y, size = 0.7, 0.2, 0.08
         spacing = size
-        self.new_comp(Text(x, y, 0.12, "Build :", (0, 0, 0), False))
+        self.new_comp(Text(x, y, 0.12, "Build :", (0, 0, 0), False), static=True)
         self.new_comp(Text(x, y + spacing * 2, size, "temp", (0, 0, 0), False), "built_wood")
         self.new_comp(Text(x, y + spacing * 3, size, "temp", (0, 0, 0), False), "built_stone")
         self.new_comp(Text(x, y + spacing * 4, size, "temp", (0, 0, 0), False), "built_fiber")
@@ -1432,53 +1508,112 @@ class SceneGameStats(SceneGameBase):
         # SUPER
         super().create()
 
-    def update(self, dt: float) -> None:
-        super().update(dt)
-
-        self.get_comp("clicked_wood").change_text("Wood : " + int_smart_str(self.game_data.stat_get("wood_clicked")))
-        self.get_comp("clicked_stone").change_text("Stone : " + int_smart_str(self.game_data.stat_get("stone_clicked")))
-        self.get_comp("clicked_fiber").change_text("Fiber : " + int_smart_str(self.game_data.stat_get("fiber_clicked")))
-        self.get_comp("clicked_iron").change_text("Iron : " + int_smart_str(self.game_data.stat_get("iron_clicked")))
-        self.get_comp("clicked_food").change_text("Food  : " + int_smart_str(self.game_data.stat_get("food_gathered")))
-        self.get_comp("clicked_elements").change_text("Elements : " + int_smart_str(self.game_data.stat_get("elements_clicked")))
-
-        self.get_comp("gathered_wood").change_text("Wood : " + int_smart_str(self.game_data.stat_get("wood_gathered")))
-        self.get_comp("gathered_stone").change_text("Stone : " + int_smart_str(self.game_data.stat_get("stone_gathered")))
-        self.get_comp("gathered_fiber").change_text("Fiber : " + int_smart_str(self.game_data.stat_get("fiber_gathered")))
-        self.get_comp("gathered_iron").change_text("Iron : " + int_smart_str(self.game_data.stat_get("iron_gathered")))
-        self.get_comp("gathered_food").change_text("Food : " + int_smart_str(self.game_data.stat_get("food_gathered")))
-        self.get_comp("gathered_elements").change_text("Elements : " + int_smart_str(self.game_data.stat_get("elements_gathered")))
-        self.get_comp("gathered_steel").change_text("Steel : " + int_smart_str(self.game_data.stat_get("steel_gathered")))
-
-        self.get_comp("built_wood").change_text("Wood : " + int_smart_str(self.game_data.production["wood"][1]))
-        self.get_comp("built_stone").change_text("Stone : " + int_smart_str(self.game_data.production["stone"][1]))
-        self.get_comp("built_fiber").change_text("Fiber : " + int_smart_str(self.game_data.production["fiber"][1]))
-        self.get_comp("built_iron").change_text("Iron : " + int_smart_str(self.game_data.production["iron"][1]))
-        self.get_comp("built_food").change_text("Food : " + int_smart_str(self.game_data.production["food"][1]))
-        self.get_comp("built_elements").change_text("Elements : " + int_smart_str(self.game_data.production["elements"][1]))
-        self.get_comp("built_steel").change_text("Steel : " + int_smart_str(self.game_data.production["steel"][1]))
-
+    def create_bindings(self) -> None:
+        super().create_bindings()
+
+        def stat(name: str) -> tuple[list[str], callable]:
+            return ["stats." + name], lambda: int_smart_str(self.game_data.stat_get(name))
+        def built(name: str) -> tuple[list[str], callable]:
+            return ["production." + name], lambda: int_smart_str(self.game_data.production[name][1])
+
+        labels = {
+            "clicked_wood"     : ("Wood : ", stat("wood_clicked")),
+            "clicked_stone"    : ("Stone : ", stat("stone_clicked")),
+            "clicked_fiber"    : ("Fiber : ", stat("fiber_clicked")),
+            "clicked_iron"     : ("Iron : ", stat("iron_clicked")),
+            "clicked_food"     : ("Food  : ", stat("food_gathered")),
+            "clicked_elements" : ("Elements : ", stat("elements_clicked")),
+
+            "gathered_wood"    : ("Wood : ", stat("wood_gathered")),
+            "gathered_stone"   : ("Stone : ", stat("stone_gathered")),
+            "gathered_fiber"   : ("Fiber : ", stat("fiber_gathered")),
+            "gathered_iron"    : ("Iron : ", stat("iron_gathered")),
+            "gathered_food"    : ("Food : ", stat("food_gathered")),
+            "gathered_elements": ("Elements : ", stat("elements_gathered")),
+            "gathered_steel"   : ("Steel : ", stat("steel_gathered")),
+
+            "built_wood"       : ("Wood : ", built("wood")),
+            "built_stone"      : ("Stone : ", built("stone")),
+            "built_fiber"      : ("Fiber : ", built("fiber")),
+            "built_iron"       : ("Iron : ", built("iron")),
+            "built_food"       : ("Food : ", built("food")),
+            "built_elements"   : ("Elements : ", built("elements")),
+            "built_steel"      : ("Steel : ", built("steel"))
+        }
+        for comp_id, (prefix, (fields, value)) in labels.items():
+            self.bind_text(comp_id, fields, lambda prefix=prefix, value=value: prefix + value())
 
 ########################################################### MANAGERS
 class SceneManager:
-    """manages all the scenes"""
+    """manages all the scenes, each scene is created and initialized the first time it's needed"""
     def __init__(self) -> None:
         self.scene_current  : callable      = None
         self.scenes         : dict[str:any] = {}
         self.history        : list[callable] = []
 
+        self.scene_factories: dict[str:callable]    = {}
+        self.scene_prewarm  : dict[str:list[str]]   = {}
+        self.prewarm_que    : list[str]             = []
+        self.prewarm_enabled: bool                  = True
+
+        self.screen_size    : tuple[int, int]   = None
+        self.game_data      : GameData          = None
+        # OWNED BY THE MAIN LOOP, SCENES ONLY READ IT (PAUSED, SPEED, TICKS)
+        self.simulation     : SimulationClock   = None
+
+        # SHARED BY ALL GAME SCENES
+        self.hud            : SceneHud          = None
+
         self.create()
-        self.switch_scene("main_menu", False)
 
-    def draw(self, surface_target: Surface) -> None:
-        self.scene_current.draw(surface_target)
+    def draw(self, surface_target: Surface) -> list[Rect]:
+        """returns changed areas of surface_target"""
+        return self.scene_current.draw(surface_target)
+
+    def invalidate(self) -> None:
+        """next draw repaints the whole window, use after the window was recreated"""
+        if self.scene_current is not None:
+            self.scene_current.component_manager.invalidate()
 
     def update(self, dt: float) -> None:
         self.scene_current.update(dt)
+        if isinstance(self.scene_current, SceneGameBase):
+            self.hud.update(dt)
 
-    def initialize(self, screen_size: tuple[int, int], game_data: GameData) -> None:
-        for scene in self.scenes.values():
-            scene.initialize(screen_size, self, game_data)
+    def initialize(self, screen_size: tuple[int, int], game_data: GameData, simulation: SimulationClock = None) -> None:
+        self.screen_size = screen_size
+        self.game_data = game_data
+        self.simulation = simulation
+
+        self.hud = SceneHud()
+        self.hud.initialize(screen_size, self, game_data)
+
+        self.switch_scene("main_menu", False)
+
+    def register(self, scene_name: str, factory: callable, prewarm: list[str] = None) -> None:
+        """registers scene factory, prewarm lists scenes likely to be opened from this one"""
+        self.scene_factories.update({scene_name: factory})
+        if prewarm is not None:
+            self.scene_prewarm.update({scene_name: prewarm})
+
+    def get_scene(self, scene_name: str) -> 'SceneBase':
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            scene = self.scene_factories[scene_name]()
+            scene.initialize(self.screen_size, self, self.game_data)
+            self.scenes.update({scene_name: scene})
+        return scene
+
+    def prewarm(self, scene_name: str) -> None:
+        for name in self.scene_prewarm.get(scene_name, []):
+            if name not in self.scenes and name not in self.prewarm_que:
+                self.prewarm_que.append(name)
+
+    def prewarm_action(self) -> None:
+        """call once per frame after the frame is shown"""
+        # ONE SCENE PER FRAME SO THE CURRENT SCENE KEEPS RUNNING
+        if self.prewarm_enabled and self.prewarm_que:
+            self.get_scene(self.prewarm_que.pop(0))
 
     def handle_key(self, key: str) -> None:
         self.scene_current.handle_key(key)
@@ -1491,21 +1626,22 @@ class SceneManager:
         self.scene_current.handle_mouse(button)
 
     def switch_scene(self, scene_name: str, n_skip: bool = True) -> None:
-        if scene_name in self.scenes.keys():
+        if scene_name in self.scene_factories.keys():
             if n_skip:
                 self.history.append(self.scene_current)
                 if len(self.history) > 100:
                     self.history.pop(0)
 
-            self.scene_current = self.scenes[scene_name]
+            self.scene_current = self.get_scene(scene_name)
+            self.scene_current.component_manager.invalidate()
             self.scene_current.on_scene_switch()
+            self.prewarm(scene_name)
 
     def back_track(self):
         if len(self.history) != 0:
-            try:
-                self.scene_current.game_data
-                self.scene_current.get_comp("AnimTransition").emit.append(Emit("BeginTransition", [self.history[-1].name, False]))
-            except AttributeError:
+            if isinstance(self.scene_current, SceneGameBase):
+                self.scene_current.get_comp("AnimTransition").send(Emit("BeginTransition", [self.history[-1].name, False]))
+            else:
                 self.switch_scene(self.history[-1].name, False)
             self.history.pop(-1)
 
@@ -1515,96 +1651,326 @@ class SceneManager:
             self.history.pop(0)
 
     def create(self) -> None:
+        game_scenes = ["game_build", "game_work", "game_battle", "game_ascend", "game_stats"]
+
         # MAIN MENU
-        self.scenes.update({"main_menu": SceneMainMenu()})
+        self.register("main_menu", SceneMainMenu, ["game_build", "settings"])
 
         # SETTINGS
-        self.scenes.update({"settings": SceneSettings()})
+        self.register("settings", SceneSettings)
 
         # Game Main
-        self.scenes.update({"game_build": SceneGameBuild()})
-        self.scenes.update({"game_work": SceneGameWork()})
-        self.scenes.update({"game_battle": SceneGameBattle()})
-        self.scenes.update({"game_ascend": SceneGameAscend()})
-        self.scenes.update({"game_stats": SceneGameStats()})
+        self.register("game_build", SceneGameBuild, game_scenes)
+        self.register("game_work", SceneGameWork, game_scenes)
+        self.register("game_battle", SceneGameBattle, game_scenes)
+        self.register("game_ascend", SceneGameAscend, game_scenes)
+        self.register("game_stats", SceneGameStats, game_scenes)
 
 class ComponentManager:
     """manages all the components in a scene"""
     def __init__(self) -> None:
         self.WINDOW_SIZE   = None
-        self.surface       = None
 
-        self.components : dict[str:Component]   = {}
-        self.remove_que : list[str]             = []
+        # HANDLE -> COMPONENT, HANDLES OF REMOVED COMPONENTS ARE REUSED FROM free_handles
+        self.handles        : list[Component]       = []
+        self.free_handles   : list[int]             = []
+        # NAME -> HANDLE, ONLY FOR COMPONENTS ADDED WITH AN ID
+        self.ids            : dict[str:int]         = {}
+        # COMPONENTS IN THE ORDER THEY ARE DRAWN
+        self.draw_list      : list[Component]       = []
+        self.remove_que     : list[int]             = []
+
+        # DIRTY RECT RENDERING
+        self.redraw_all : bool          = True
+        self.dirty_rects: list[Rect]    = []
+
+        # STATIC LAYER
+        self.static_layer: Surface  = None
+        self.static_dirty: bool     = True
+        # PART OF THE STATIC LAYER THAT HOLDS COMPONENTS, ONLY KEPT FOR MANAGERS DRAWN AS AN OVERLAY
+        self.static_bounds: Rect    = None
+
+        # LAST FRAME
+        self.drawn_count  : int = 0
+        self.culled_count : int = 0
+        self.updated_count: int = 0
+
+        # ONLY COMPONENTS WITH AN update_function ARE UPDATED, DICT KEEPS THE ORDER THEY WERE ADDED IN
+        self.active     : dict[Component:None]  = {}
+        # COMPONENTS THAT SENT EMITS SINCE THE LAST emit_action
+        self.emit_que   : dict[Component:None]  = {}
+
+        # HIT TESTING, ONLY BUTTONS AND HOVERABLE COMPONENTS ARE INDEXED
+        self.hit_grid   : SpatialGrid       = SpatialGrid()
+        self.hit_moved  : set[Component]    = set()
+        # COMPONENTS WHOSE hover_func STILL EXPECTS A CALL
+        self.hover_watch: set[Component]    = set()
+
+        # COMPONENTS OF ANOTHER MANAGER DRAWN ON TOP OF THESE ONES, ITS STATIC ONES ARE BAKED INTO ITS OWN LAYER
+        self.overlay: ComponentManager = None
+        # OVERLAY IS DRAWN UNDER THIS COMPONENT AND ALL AFTER IT (TRANSITIONS, FLASHES), ON TOP OF EVERYTHING IF None
+        self.overlay_below: Component = None
 
         self.scene_link = None
 
     def initialize(self, screen_size: tuple[int, int], scene_link: SceneBase, game_data: GameData = None) -> None:
         self.WINDOW_SIZE    : tuple[int, int]   = screen_size
-        self.surface        : Surface           = Surface(self.WINDOW_SIZE)
         self.scene_link     : SceneBase         = scene_link
 
-        for component in self.components.values():
+        for component in self.draw_list:
             if component.__class__.__name__ == "ShopButton":
                 component.initialize(self.WINDOW_SIZE, self, game_data)
             else:
                 component.initialize(self.WINDOW_SIZE, self)
 
-    def draw(self, surface_target: Surface) -> None:
-        self.surface.fill((0, 0, 0), [0, 0, self.WINDOW_SIZE[0], self.WINDOW_SIZE[1]])
-
-        for component in self.components.values():
-            self.surface.blit(component.surface, component.position)
-
-        surface_target.blit(self.surface, (0, 0))
+    def invalidate(self) -> None:
+        self.redraw_all = True
+
+    def draw_static_layer(self) -> None:
+        if self.static_layer is None:
+            self.static_layer = Surface(self.WINDOW_SIZE)
+            if pygame.display.get_surface() is not None:
+                self.static_layer = self.static_layer.convert()
+
+        self.static_layer.fill((0, 0, 0))
+        window_rect = self.static_layer.get_rect()
+        for component in self.draw_list:
+            if component.static and component.visible and component.rect_drawn.colliderect(window_rect):
+                self.static_layer.blit(component.surface, component.position)
+        self.static_dirty = False
+
+    def draw_overlay_layer(self) -> None:
+        """static layer with alpha that only covers the static components, for a manager drawn as another one's overlay"""
+        if self.static_layer is None:
+            self.static_layer = Surface(self.WINDOW_SIZE, SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                self.static_layer = self.static_layer.convert_alpha()
+
+        self.static_layer.fill((0, 0, 0, 0))
+        self.static_bounds = None
+        window_rect = self.static_layer.get_rect()
+        for component in self.draw_list:
+            if component.static and component.visible and component.rect_drawn.colliderect(window_rect):
+                # PREMULTIPLIED, ALPHA BAKED ONTO ALPHA THEN BLENDS AS IF EVERY COMPONENT WAS BLITTED ONTO THE FRAME
+                surface = component.surface
+                if surface.get_flags() & SRCALPHA:
+                    self.static_layer.blit(surface.premul_alpha(), component.position, special_flags=BLEND_PREMULTIPLIED)
+                else:
+                    self.static_layer.blit(surface, component.position)
+                self.static_bounds = component.rect_drawn if self.static_bounds is None else self.static_bounds.union(component.rect_drawn)
+        self.static_dirty = False
+
+    def collect_dirty(self) -> list[Rect]:
+        """old and new area of every changed component, clears their dirty flags"""
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        for component in self.draw_list:
+            if component.dirty:
+                component.dirty = False
+                if component.static:
+                    self.static_dirty = True
+                if component.rect_drawn is not None:
+                    rects.append(component.rect_drawn)
+                component.rect_drawn = Rect(component.position, component.surface.get_size())
+                rects.append(component.rect_drawn)
+        return rects
+
+    def draw(self, surface_target: Surface) -> list[Rect]:
+        """redraws only areas of dirty components, returns them for display.update"""
+        window_rect = surface_target.get_rect()
+
+        rects = self.collect_dirty()
+        if self.overlay is not None:
+            rects += self.overlay.collect_dirty()
+            if self.overlay.static_dirty:
+                self.overlay.draw_overlay_layer()
+
+        if self.static_dirty:
+            self.draw_static_layer()
+
+        if self.redraw_all:
+            self.redraw_all = False
+            rects = [window_rect]
+        else:
+            rects = merge_rects([rect.clip(window_rect) for rect in rects if rect.colliderect(window_rect)])
+
+        self.drawn_count = 0
+        self.culled_count = 0
+        if not rects:
+            return rects
+
+        # CULL DYNAMIC COMPONENTS OUTSIDE THE WINDOW AND INVISIBLE ONES
+        visible = []
+        overlay_at = None
+        for component in self.draw_list:
+            if component is self.overlay_below:
+                overlay_at = len(visible)
+            if component.static or not component.visible:
+                continue
+            if component.rect_drawn.colliderect(window_rect):
+                visible.append(component)
+            else:
+                self.culled_count += 1
+        overlay_bounds = None
+        if overlay_at is None:
+            overlay_at = len(visible)
+        if self.overlay is not None:
+            overlay_bounds = self.overlay.static_bounds
+            visible[overlay_at:overlay_at] = [component for component in self.overlay.draw_list
+                                              if not component.static and component.visible and component.rect_drawn.colliderect(window_rect)]
+        below, above = visible[:overlay_at], visible[overlay_at:]
+
+        for rect in rects:
+            surface_target.set_clip(rect)
+            surface_target.blit(self.static_layer, rect, rect)
+            self.blit_components(surface_target, rect, below)
+            # OVERLAY STATICS GO IN BETWEEN AS ONE BLIT OF THE AREA THEY COVER
+            if overlay_bounds is not None and rect.colliderect(overlay_bounds):
+                area = rect.clip(overlay_bounds)
+                surface_target.blit(self.overlay.static_layer, area, area, special_flags=BLEND_PREMULTIPLIED)
+                self.drawn_count += 1
+            self.blit_components(surface_target, rect, above)
+        surface_target.set_clip(None)
+
+        return rects
+
+    def blit_components(self, surface_target: Surface, rect: Rect, components: list[Component]) -> None:
+        for component in components:
+            if rect.colliderect(component.rect_drawn):
+                component.blit(surface_target)
+                self.drawn_count += 1
+
+    def draw_stats(self) -> dict[str:int]:
+        """blits done and components culled in the last draw"""
+        return {
+            "drawn" : self.drawn_count,
+            "culled": self.culled_count
+        }
+
+    def update_stats(self) -> dict[str:int]:
+        """components updated or hovered in the last update and how many are active"""
+        return {
+            "updated": self.updated_count,
+            "active" : len(self.active)
+        }
 
     def update(self, dt: float) -> None:
-        for component in self.components.values():
-            # update
+        self.updated_count = 0
+        for component in list(self.active):
             component.update(dt)
-
-            # emit
-            if component.emit:
-                for emit in component.emit:
-                    self.scene_link.scene_manager_link.scene_current.handel_emit(emit)
-            component.emit = []
-
+            self.updated_count += 1
+            # FINISHED ANIMATIONS CLEAR THEIR update_function
+            if component.update_function is None:
+                self.active.pop(component, None)
+        self.emit_action()
+
+        self.hover_action()
+        self.emit_action()
         self.remove_action()
 
+    def activate(self, component: Component) -> None:
+        """updates component every frame again, use after giving it an update_function"""
+        if component.update_function is not None:
+            self.active[component] = None
+
+    def emit_action(self) -> None:
+        """hands emits sent since the last call to the current scene"""
+        que, self.emit_que = self.emit_que, {}
+        for component in que:
+            emits, component.emit = component.emit, []
+            for emit in emits:
+                self.scene_link.scene_manager_link.scene_current.handel_emit(emit)
+
+    def hit_update(self) -> None:
+        """re-indexes hit boxes of components moved or redrawn since the last query"""
+        for component in self.hit_moved:
+            if component in self.hit_grid.order and component.surface is not None:
+                self.hit_grid.move(component, Rect(component.position, component.surface.get_size()))
+        self.hit_moved.clear()
+
+    def hit_query(self, point: tuple[int, int]) -> list[Component]:
+        """indexed components under point in the order they were added"""
+        self.hit_update()
+        return [component for component in self.hit_grid.query(point) if component.hit(point)]
+
+    def hover_action(self) -> None:
+        """reads the mouse once, calls hover_func of components under it and of ones it just left"""
+        mouse_pos = pygame.mouse.get_pos()
+        hovered = [component for component in self.hit_query(mouse_pos) if component.hover_func is not None and component.initialized]
+
+        for component in hovered:
+            component.hover(True)
+        for component in list(self.hover_watch):
+            if component not in hovered and component.initialized:
+                component.hover(False)
+                self.hover_watch.discard(component)
+                self.updated_count += 1
+        self.hover_watch.update(hovered)
+        self.updated_count += len(hovered)
+
     def shop_cost_reset(self):
-        for comp in self.components.values():
+        for comp in self.draw_list:
             if comp.__class__.__name__ == "ShopButton":
                 comp.reset()
 
     def handle_mouse(self, button: int) -> None:
-        for component in self.components.values():
+        mouse_pos = pygame.mouse.get_pos()
+        for component in self.hit_query(mouse_pos):
             if "button" in component.tags:
-                component.check_click(button)
-
-    def new_component(self, component: Component, comp_id: str = "") -> None:
-        if comp_id:
-            self.components.update({comp_id: component})
+                component.click(button)
+
+    def new_component(self, component: Component, comp_id: str = "") -> int:
+        """adds component on top of the draw list and returns its handle, comp_id also makes it reachable by name"""
+        if component.hover_func is not None or "button" in component.tags:
+            self.hit_grid.add(component)
+            self.hit_moved.add(component)
+        if component.hover_func is not None:
+            self.hover_watch.add(component)
+        self.activate(component)
+
+        if self.free_handles:
+            component.handle = self.free_handles.pop()
+            self.handles[component.handle] = component
         else:
-            keys = list(self.components.keys())
-            next_number = 0
+            component.handle = len(self.handles)
+            self.handles.append(component)
+        self.draw_list.append(component)
 
-            while True:
-                temp_next_number = randint(1000, 9999)
-                if temp_next_number not in keys:
-                    next_number = temp_next_number
-                    break
-
-            self.components.update({str(next_number): component})
+        if comp_id:
+            self.ids[comp_id] = component.handle
+        return component.handle
 
-    def get_component(self, comp_id: str) -> Component:
-        return self.components[comp_id]
+    def get_component(self, comp_id: str | int) -> Component:
+        """comp_id is the name given to new_component or the handle it returned"""
+        if isinstance(comp_id, int):
+            return self.handles[comp_id]
+        return self.handles[self.ids[comp_id]]
 
-    def remove(self, comp_id: str):
-        if comp_id not in self.remove_que:
-            self.remove_que.append(comp_id)
+    def remove(self, comp_id: str | int):
+        handle = comp_id if isinstance(comp_id, int) else self.ids[comp_id]
+        if handle not in self.remove_que:
+            self.remove_que.append(handle)
 
     def remove_action(self):
         if len(self.remove_que):
-            for comp_id in self.remove_que:
-                self.components.pop(comp_id)
-                self.remove_que.remove(comp_id)
\ No newline at end of file
+            removed = set()
+            for handle in self.remove_que:
+                component = self.handles[handle]
+                if component.rect_drawn is not None:
+                    self.dirty_rects.append(component.rect_drawn)
+                self.hit_grid.remove(component)
+                self.hit_moved.discard(component)
+                self.hover_watch.discard(component)
+                self.active.pop(component, None)
+                self.emit_que.pop(component, None)
+
+                self.handles[handle] = None
+                self.free_handles.append(handle)
+                component.handle = -1
+                removed.add(component)
+            self.remove_que = []
+
+            self.ids = {comp_id: handle for comp_id, handle in self.ids.items() if self.handles[handle] is not None}
+            self.draw_list = [component for component in self.draw_list if component not in removed]
+            if self.overlay_below in removed:
+                self.overlay_below = None
\ No newline at end of file